@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import logging
+from pathlib import Path
+from typing import Any, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+# Containers whose AAC track can be spliced and remuxed packet-for-packet.
+SPLICE_CONTAINER_SUFFIXES = frozenset({".mp4", ".m4a", ".m4v", ".mov"})
+
+
+def _import_av() -> Any:
+    """Return the optional `av` (PyAV) module, or None if it is not installed."""
+    try:
+        import av  # type: ignore
+    except ImportError:
+        return None
+    return av
+
+
+class IntervalCursor:
+    """
+    Forward-only overlap test against sorted, disjoint `(start, end)` intervals
+    (see `video_tools._span_intervals`).
+
+    Queries must come in time order (as demuxed packets do); one pointer walks
+    the intervals, so a whole track costs O(packets + intervals).
+    """
+
+    def __init__(self, intervals: Sequence[Tuple[float, float]]) -> None:
+        self._intervals = intervals
+        self._i = 0
+
+    def overlaps(self, start: float, end: float) -> bool:
+        intervals = self._intervals
+        i = self._i
+        while i < len(intervals) and intervals[i][1] <= start:
+            i += 1
+        self._i = i
+        return i < len(intervals) and intervals[i][0] < end
+
+
+def _silent_frame(av: Any, stream: Any) -> Optional[bytes]:
+    """Encode one AAC frame of silence matching `stream`'s rate and layout."""
+    ctx = stream.codec_context
+    encoder = av.CodecContext.create("aac", "w")
+    encoder.sample_rate = ctx.sample_rate
+    encoder.layout = ctx.layout
+    encoder.format = "fltp"
+    encoder.time_base = stream.time_base
+    encoder.open()
+
+    frame_size = encoder.frame_size or 1024
+    packets: List[Any] = []
+    # A few frames so the encoder is past its priming output.
+    for pts in range(0, 4 * frame_size, frame_size):
+        frame = av.AudioFrame(format="fltp", layout=ctx.layout, samples=frame_size)
+        for plane in frame.planes:
+            plane.update(bytes(plane.buffer_size))
+        frame.sample_rate = ctx.sample_rate
+        frame.pts = pts
+        packets.extend(encoder.encode(frame))
+    packets.extend(encoder.encode(None))
+
+    payloads = [bytes(p) for p in packets if p.size]
+    return payloads[len(payloads) // 2] if payloads else None
+
+
+def splice_silence_into_aac(
+    input_video: Path,
+    output_audio: Path,
+    intervals: Sequence[Tuple[float, float]],
+) -> bool:
+    """
+    Write the input's primary AAC track to `output_audio` (an .m4a) with every
+    packet overlapping `intervals` replaced by a silent AAC frame.
+
+    No decode/encode round trip: all other packets are copied as-is, so the
+    result can be muxed back with `-c copy`. Needs the optional PyAV package.
+    Returns False (writing nothing usable) when PyAV is missing or the track
+    is not plain AAC-LC in a supported container; callers then fall back to
+    the ffmpeg filter path.
+    """
+    av = _import_av()
+    if av is None or input_video.suffix.lower() not in SPLICE_CONTAINER_SUFFIXES:
+        return False
+
+    try:
+        with av.open(str(input_video), "r") as src:
+            if not src.streams.audio:
+                return False
+            in_stream = src.streams.audio[0]
+            ctx = in_stream.codec_context
+            if ctx.name != "aac" or (ctx.profile or "LC") != "LC":
+                return False
+
+            silent = _silent_frame(av, in_stream)
+            if silent is None:
+                return False
+
+            with av.open(str(output_audio), "w", format="ipod") as dst:
+                out_stream = dst.add_stream_from_template(in_stream)
+                time_base = in_stream.time_base
+                # Interval times are relative to the start of the audio, like
+                # ffmpeg's filter `t`.
+                origin = in_stream.start_time or 0
+                cursor = IntervalCursor(intervals)
+
+                for packet in src.demux(in_stream):
+                    if packet.dts is None:
+                        continue  # demuxer flush packet
+
+                    pts = packet.pts if packet.pts is not None else packet.dts
+                    start = float((pts - origin) * time_base)
+                    end = start + float((packet.duration or 0) * time_base)
+                    if cursor.overlaps(start, end):
+                        replacement = av.Packet(silent)
+                        replacement.pts = packet.pts
+                        replacement.dts = packet.dts
+                        replacement.duration = packet.duration
+                        replacement.time_base = time_base
+                        packet = replacement
+
+                    packet.stream = out_stream
+                    dst.mux(packet)
+    except (av.error.FFmpegError, OSError, ValueError) as exc:  # type: ignore[attr-defined]
+        logger.warning("AAC splice failed for %s; falling back to re-encode: %s", input_video, exc)
+        return False
+
+    return True
@@ -1,19 +1,85 @@
 from __future__ import annotations
 
 import contextlib
+import csv
+import struct
 import subprocess
+import tempfile
 import wave
 from dataclasses import dataclass
 from pathlib import Path
-from typing import List
+from typing import Iterator, List, Optional
+
+
+# Whisper requires a minimum audio duration (~0.1s). Very short tail chunks
+# cause 400 "audio_too_short" errors, so chunkers skip them.
+MIN_CHUNK_DURATION_SECONDS = 0.11
+
+# Keep ffmpeg's stderr down to actual errors (no banner/progress lines), so it
+# stays small enough to buffer and is only read on the failure path.
+FFMPEG_QUIET_ARGS = ("-loglevel", "error", "-nostats")
 
 
 @dataclass
 class AudioChunk:
     index: int
-    path: Path
+    path: Optional[Path]  # None for in-memory chunks
     start_time: float  # seconds in full audio
     duration: float  # seconds
+    # In-memory WAV bytes (header + PCM). When set, backends read this instead of `path`.
+    data: Optional[bytes] = None
+
+
+def _wav_header(n_data_bytes: int, sample_rate: int, n_channels: int = 1, sampwidth: int = 2) -> bytes:
+    """Return a canonical 44-byte PCM WAV header for `n_data_bytes` of sample data."""
+
+    block_align = n_channels * sampwidth
+    return struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF",
+        36 + n_data_bytes,
+        b"WAVE",
+        b"fmt ",
+        16,  # fmt chunk size
+        1,  # PCM
+        n_channels,
+        sample_rate,
+        sample_rate * block_align,
+        block_align,
+        sampwidth * 8,
+        b"data",
+        n_data_bytes,
+    )
+
+
+@contextlib.contextmanager
+def _ffmpeg_streaming(cmd: List[str], *, what: str, text: bool) -> Iterator[subprocess.Popen]:
+    """Run ffmpeg with stdout piped to the caller; raise RuntimeError if it fails.
+
+    stderr goes to a temp file so a chatty ffmpeg can never block on a full pipe
+    while the caller is only reading stdout. If the caller stops early (or
+    fails), ffmpeg is killed rather than left running.
+    """
+
+    with tempfile.TemporaryFile() as stderr_file:
+        proc = subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=stderr_file,
+            text=text,
+        )
+        try:
+            yield proc
+            returncode = proc.wait()
+        finally:
+            if proc.poll() is None:
+                proc.kill()
+                proc.wait()
+
+        if returncode != 0:
+            stderr_file.seek(0)
+            stderr = stderr_file.read().decode("utf-8", "replace")
+            raise RuntimeError(f"ffmpeg {what} failed with code {returncode}: {stderr}")
 
 
 def extract_mono_pcm_audio(input_video: Path, output_wav: Path, sample_rate: int = 16000) -> Path:
@@ -24,11 +90,12 @@ def extract_mono_pcm_audio(input_video: Path, output_wav: Path, sample_rate: int
         ffmpeg -i INPUT_FILE -vn -acodec pcm_s16le -ar 16000 -ac 1 audio.wav
     """
 
-    output_wav = output_wav.expanduser().resolve()
+    output_wav = output_wav.expanduser()
     output_wav.parent.mkdir(parents=True, exist_ok=True)
 
     cmd = [
         "ffmpeg",
+        *FFMPEG_QUIET_ARGS,
         "-y",
         "-i",
         str(input_video),
@@ -44,7 +111,7 @@ def extract_mono_pcm_audio(input_video: Path, output_wav: Path, sample_rate: int
 
     result = subprocess.run(
         cmd,
-        stdout=subprocess.PIPE,
+        stdout=subprocess.DEVNULL,
         stderr=subprocess.PIPE,
         text=True,
     )
@@ -60,6 +127,164 @@ def extract_mono_pcm_audio(input_video: Path, output_wav: Path, sample_rate: int
     return output_wav
 
 
+def extract_and_chunk(
+    input_video: Path,
+    chunks_dir: Path,
+    chunk_length_seconds: int,
+    sample_rate: int = 16000,
+    *,
+    debug_audio_path: Optional[Path] = None,
+) -> Iterator[AudioChunk]:
+    """
+    Extract mono PCM audio from input video and split it into chunks in one ffmpeg run.
+
+    This avoids writing (and re-reading) an intermediate full-length audio.wav.
+    When `debug_audio_path` is given, the full extracted audio is written there as
+    a second output of the same ffmpeg invocation, so the input is decoded once.
+
+    Chunks are yielded as soon as ffmpeg closes each segment (ffmpeg reports
+    finished segments on stdout via `-segment_list`), so callers can start
+    transcribing the first chunks while later ones are still being extracted.
+
+    Equivalent to:
+        ffmpeg -i INPUT_FILE -vn -ac 1 -ar 16000 -acodec pcm_s16le \
+            -f segment -segment_time N -segment_list pipe:1 chunk_%03d.wav [... audio.wav]
+    """
+
+    if chunk_length_seconds <= 0:
+        raise ValueError("chunk_length_seconds must be positive.")
+
+    chunks_dir = chunks_dir.expanduser()
+    chunks_dir.mkdir(parents=True, exist_ok=True)
+
+    pcm_args = [
+        "-vn",
+        "-acodec",
+        "pcm_s16le",
+        "-ar",
+        str(sample_rate),
+        "-ac",
+        "1",
+    ]
+
+    cmd = [
+        "ffmpeg",
+        *FFMPEG_QUIET_ARGS,
+        "-y",
+        "-i",
+        str(input_video),
+        *pcm_args,
+        "-f",
+        "segment",
+        "-segment_time",
+        str(chunk_length_seconds),
+        "-reset_timestamps",
+        "1",
+        # One "name,start,end" line per finished segment.
+        "-segment_list",
+        "pipe:1",
+        "-segment_list_type",
+        "csv",
+        str(chunks_dir / "chunk_%03d.wav"),
+    ]
+
+    if debug_audio_path is not None:
+        debug_audio_path = debug_audio_path.expanduser()
+        debug_audio_path.parent.mkdir(parents=True, exist_ok=True)
+        cmd.extend([*pcm_args, str(debug_audio_path)])
+
+    produced = 0
+    with _ffmpeg_streaming(cmd, what="audio extraction", text=True) as proc:
+        for row in csv.reader(proc.stdout):  # type: ignore[arg-type]
+            if len(row) < 3:
+                continue
+            name, seg_start, seg_end = row[0], float(row[1]), float(row[2])
+            produced += 1
+
+            duration = seg_end - seg_start
+            if duration < MIN_CHUNK_DURATION_SECONDS:
+                continue
+
+            chunk_path = chunks_dir / name
+            yield AudioChunk(
+                index=int(chunk_path.stem.split("_")[-1]),
+                path=chunk_path,
+                start_time=seg_start,
+                duration=duration,
+            )
+
+    if not produced:
+        raise RuntimeError(f"ffmpeg did not produce any audio chunks in: {chunks_dir}")
+
+
+def stream_pcm_chunks(
+    input_video: Path,
+    chunk_length_seconds: int,
+    sample_rate: int = 16000,
+) -> Iterator[AudioChunk]:
+    """
+    Decode input video to mono PCM on ffmpeg's stdout and yield in-memory chunks.
+
+    Nothing is written to disk: each chunk carries a synthesized WAV (44-byte
+    header + PCM body) in `AudioChunk.data` and has `path=None`. Chunks are
+    yielded as soon as enough PCM has been read, so transcription overlaps
+    decoding.
+
+    Equivalent to:
+        ffmpeg -i INPUT_FILE -vn -acodec pcm_s16le -ar 16000 -ac 1 -f s16le pipe:1
+    """
+
+    frames_per_chunk = int(chunk_length_seconds * sample_rate)
+    if frames_per_chunk <= 0:
+        raise ValueError("chunk_length_seconds must be positive.")
+
+    bytes_per_frame = 2  # mono, 16-bit
+    chunk_bytes = frames_per_chunk * bytes_per_frame
+
+    cmd = [
+        "ffmpeg",
+        *FFMPEG_QUIET_ARGS,
+        "-y",
+        "-i",
+        str(input_video),
+        "-vn",
+        "-acodec",
+        "pcm_s16le",
+        "-ar",
+        str(sample_rate),
+        "-ac",
+        "1",
+        "-f",
+        "s16le",
+        "pipe:1",
+    ]
+
+    produced = 0
+    with _ffmpeg_streaming(cmd, what="audio extraction", text=False) as proc:
+        index = 0
+        while True:
+            # BufferedReader.read(n) blocks until n bytes are available or EOF.
+            pcm = proc.stdout.read(chunk_bytes)  # type: ignore[union-attr]
+            if not pcm:
+                break
+            produced += 1
+
+            duration = len(pcm) / float(sample_rate * bytes_per_frame)
+            start_time = index * frames_per_chunk / float(sample_rate)
+            if duration >= MIN_CHUNK_DURATION_SECONDS:
+                yield AudioChunk(
+                    index=index,
+                    path=None,
+                    start_time=start_time,
+                    duration=duration,
+                    data=_wav_header(len(pcm), sample_rate) + pcm,
+                )
+            index += 1
+
+    if not produced:
+        raise RuntimeError(f"ffmpeg did not produce any audio for: {input_video}")
+
+
 def _compute_duration_seconds(wav_path: Path) -> float:
     with contextlib.closing(wave.open(str(wav_path), "rb")) as wf:
         frames = wf.getnframes()
@@ -76,6 +301,9 @@ def chunk_audio(
     Split audio.wav into N chunks of roughly `chunk_length_seconds`.
 
     Returns a list of AudioChunk objects with absolute start offsets.
+
+    Standalone helper: run_pipeline chunks with `extract_and_chunk` or
+    `stream_pcm_chunks` instead.
     """
 
     input_wav = input_wav.expanduser().resolve()
@@ -99,27 +327,14 @@ def chunk_audio(
         if frames_per_chunk <= 0:
             raise ValueError("chunk_length_seconds must be positive.")
 
-        total_chunks = (n_frames + frames_per_chunk - 1) // frames_per_chunk
-
-        # Whisper requires a minimum audio duration (~0.1s). Very short tail
-        # chunks will cause 400 "audio_too_short" errors, so we skip them.
-        min_chunk_duration_seconds = 0.11
-
-        for index in range(total_chunks):
-            start_frame = index * frames_per_chunk
-            src.setpos(start_frame)
-
+        for index, start_frame in enumerate(range(0, n_frames, frames_per_chunk)):
             frames_to_read = min(frames_per_chunk, n_frames - start_frame)
-            if frames_to_read <= 0:
-                break
-
             duration = frames_to_read / float(framerate)
-            if duration < min_chunk_duration_seconds:
-                # Read and discard frames to advance the file pointer, but do not
-                # emit a chunk that the STT API would reject as too short.
-                src.readframes(frames_to_read)
+            if duration < MIN_CHUNK_DURATION_SECONDS:
+                # Only ever the tail; the STT API would reject it as too short.
                 continue
 
+            src.setpos(start_frame)
             audio_data = src.readframes(frames_to_read)
 
             chunk_path = temp_dir / f"chunk_{index:03d}.wav"
@@ -129,15 +344,13 @@ def chunk_audio(
                 dst.setframerate(framerate)
                 dst.writeframes(audio_data)
 
-            start_time = start_frame / float(framerate)
-
             chunks.append(
                 AudioChunk(
                     index=index,
                     path=chunk_path,
-                    start_time=start_time,
+                    start_time=start_frame / float(framerate),
                     duration=duration,
                 )
             )
 
-    return chunks
\ No newline at end of file
+    return chunks
@@ -5,7 +5,7 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import List, Literal, Optional, TypeVar, get_args
 
-from dotenv import load_dotenv
+from dotenv import dotenv_values
 
 
 Mode = Literal["mute", "bleep"]
@@ -23,6 +23,8 @@ class AppConfig:
     profanity_list_path: Optional[Path] = None
     audio_language: str = "en"
     chunk_length_seconds: int = 300
+    # Number of chunks transcribed concurrently (None = pick automatically).
+    chunk_workers: Optional[int] = None
     min_confidence: float = 0.6
     max_gap_combine_ms: int = 500
     bleep_sound_path: Optional[Path] = None
@@ -47,9 +49,45 @@ class AppConfig:
     # Pipeline control
     # When True, bypass "already-clean" detection and force processing.
     force: bool = False
+    # When True, reuse a cached transcript under output_dir/transcript_cache if the
+    # input file and transcription settings are unchanged.
+    transcript_cache: bool = True
+    # When True, an input with nothing to censor is still remuxed through
+    # ffmpeg (`-c copy`) instead of being copied to the output.
+    force_remux: bool = False
+    # When True, an input with nothing to censor is hard-linked to the output
+    # (same inode as the input) instead of copied. Off by default.
+    hardlink_output: bool = False
+    # When True (and PyAV is installed), mute mode splices silent frames into
+    # an AAC primary track instead of re-encoding it. Experimental, off by default.
+    aac_splice: bool = False
 
     # Derived / loaded values
     profanity_terms: List[str] = field(default_factory=list)
+    # Hashed view of `profanity_terms` for O(1) exact-word lookups.
+    profanity_set: frozenset[str] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        # Normalize terms exactly once: stripped, lowercased, de-duplicated
+        # (first occurrence wins, so list order is preserved for regex builds).
+        self.profanity_terms = list(
+            dict.fromkeys(w.strip().lower() for w in self.profanity_terms if w.strip())
+        )
+        self.profanity_set = frozenset(self.profanity_terms)
+
+        # Resolve every path once here so downstream helpers can use them as-is
+        # instead of re-running expanduser()/resolve() on each call.
+        self.input_path = _resolve_path(self.input_path)
+        self.output_path = _resolve_path(self.output_path)
+        self.output_dir = _resolve_path(self.output_dir)
+        if self.profanity_list_path is not None:
+            self.profanity_list_path = _resolve_path(self.profanity_list_path)
+        if self.bleep_sound_path is not None:
+            self.bleep_sound_path = _resolve_path(self.bleep_sound_path)
+
+
+def _resolve_path(path: Path) -> Path:
+    return Path(path).expanduser().resolve()
 
 
 DEFAULT_PROFANITY_WORDS_EN: List[str] = [
@@ -70,19 +108,19 @@ _T = TypeVar("_T")
 
 def _env_get(name: str) -> Optional[str]:
     """Return env var value stripped, treating empty/whitespace as missing."""
-    raw = os.getenv(name)
+    raw = os.environ.get(name)
     if raw is None:
         return None
-    value = str(raw).strip()
-    return value or None
+    return raw.strip() or None
+
+
+_BOOL_VALUES = {"true": True, "false": False}
 
 
 def _parse_bool(value: str, *, var_name: str) -> bool:
-    v = value.strip().lower()
-    if v == "true":
-        return True
-    if v == "false":
-        return False
+    parsed = _BOOL_VALUES.get(value.strip().lower())
+    if parsed is not None:
+        return parsed
     raise ValueError(
         f"Invalid boolean for {var_name}={value!r}. Expected 'true' or 'false' (case-insensitive)."
     )
@@ -188,6 +226,28 @@ def load_default_profanity_list(language: str) -> List[str]:
     return DEFAULT_PROFANITY_WORDS_EN
 
 
+# Parsed .env contents keyed by path, tagged with the file's mtime_ns so edits
+# are picked up while repeated loads in one process skip the re-parse.
+_DOTENV_CACHE: dict[Path, tuple[int, dict[str, str]]] = {}
+
+
+def _load_dotenv_cached(path: Path) -> None:
+    """
+    Equivalent to `load_dotenv(path, override=False)`, memoized on file mtime.
+
+    Keys already present in the environment are left untouched.
+    """
+    mtime_ns = path.stat().st_mtime_ns
+    cached = _DOTENV_CACHE.get(path)
+    if cached is None or cached[0] != mtime_ns:
+        values = {k: v for k, v in dotenv_values(path).items() if v is not None}
+        cached = (mtime_ns, values)
+        _DOTENV_CACHE[path] = cached
+
+    for key, value in cached[1].items():
+        os.environ.setdefault(key, value)
+
+
 def load_config_from_args(args) -> AppConfig:
     """Create an AppConfig from parsed argparse.Namespace."""
 
@@ -198,12 +258,12 @@ def load_config_from_args(args) -> AppConfig:
     legacy_env = Path(__file__).resolve().parent / ".env"
 
     if root_env.exists():
-        load_dotenv(dotenv_path=root_env, override=False)
+        _load_dotenv_cached(root_env)
     elif legacy_env.exists():
-        load_dotenv(dotenv_path=legacy_env, override=False)
+        _load_dotenv_cached(legacy_env)
 
-    input_path = Path(args.input).expanduser().resolve()
-    output_path = Path(args.output).expanduser().resolve()
+    input_path = Path(args.input).expanduser()
+    output_path = Path(args.output)
 
     if not input_path.exists():
         raise FileNotFoundError(f"Input file does not exist: {input_path}")
@@ -227,6 +287,14 @@ def load_config_from_args(args) -> AppConfig:
         _env_int("CHUNK_LENGTH_SECONDS"),
         300,
     )
+    chunk_workers = _coalesce(
+        getattr(args, "chunk_workers", None),
+        _env_int("CHUNK_WORKERS"),
+        None,
+    )
+    if chunk_workers is not None and int(chunk_workers) < 1:
+        raise ValueError(f"Invalid chunk workers {chunk_workers!r}; expected a positive integer.")
+
     min_confidence = _coalesce(
         getattr(args, "min_confidence", None),
         _env_float("MIN_CONFIDENCE"),
@@ -265,6 +333,30 @@ def load_config_from_args(args) -> AppConfig:
         False,
     )
 
+    transcript_cache = _coalesce(
+        getattr(args, "transcript_cache", None),
+        _env_bool("TRANSCRIPT_CACHE"),
+        True,
+    )
+
+    force_remux = _coalesce(
+        getattr(args, "force_remux", None),
+        _env_bool("FORCE_REMUX"),
+        False,
+    )
+
+    hardlink_output = _coalesce(
+        getattr(args, "hardlink_output", None),
+        _env_bool("HARDLINK_OUTPUT"),
+        False,
+    )
+
+    aac_splice = _coalesce(
+        getattr(args, "aac_splice", None),
+        _env_bool("AAC_SPLICE"),
+        False,
+    )
+
     whisper_model = _coalesce(
         getattr(args, "whisper_model", None),
         _env_get("WHISPER_MODEL"),
@@ -283,7 +375,7 @@ def load_config_from_args(args) -> AppConfig:
         _env_get("OUTPUT_DIR"),
         "out",
     )
-    output_dir = Path(output_dir_raw).expanduser().resolve()
+    output_dir = Path(output_dir_raw)
 
     profanity_list_raw = _coalesce(
         getattr(args, "profanity_list", None),
@@ -300,7 +392,7 @@ def load_config_from_args(args) -> AppConfig:
     profanity_terms: List[str] = []
 
     if profanity_list_raw:
-        profanity_list_path = Path(profanity_list_raw).expanduser().resolve()
+        profanity_list_path = Path(profanity_list_raw).expanduser()
         if not profanity_list_path.exists():
             raise FileNotFoundError(
                 f"Profanity list file not found: {profanity_list_path}"
@@ -326,7 +418,8 @@ def load_config_from_args(args) -> AppConfig:
                 raise ValueError(
                     "Profanity list JSON must be a list of strings (words/phrases)."
                 )
-            profanity_terms = [w.strip().lower() for w in data if w.strip()]
+            # Normalized (strip/lowercase/dedupe) once by AppConfig.
+            profanity_terms = [w for w in data if w.strip()]
     else:
         profanity_terms = load_default_profanity_list(audio_language)
 
@@ -337,17 +430,20 @@ def load_config_from_args(args) -> AppConfig:
         profanity_list_path=profanity_list_path,
         audio_language=audio_language,
         chunk_length_seconds=int(chunk_length_seconds),
+        chunk_workers=int(chunk_workers) if chunk_workers is not None else None,
         min_confidence=float(min_confidence),
         max_gap_combine_ms=int(max_gap_combine_ms),
-        bleep_sound_path=Path(bleep_sound_path_raw).expanduser().resolve()
-        if bleep_sound_path_raw
-        else None,
+        bleep_sound_path=Path(bleep_sound_path_raw) if bleep_sound_path_raw else None,
         output_dir=output_dir,
         emit_clean_transcript=bool(emit_clean_transcript),
         emit_subtitles=bool(emit_subtitles),
         verbose=bool(verbose),
         debug_dump_audio=bool(debug_dump_audio),
         force=bool(force),
+        transcript_cache=bool(transcript_cache),
+        force_remux=bool(force_remux),
+        hardlink_output=bool(hardlink_output),
+        aac_splice=bool(aac_splice),
         profanity_terms=profanity_terms,
         whisper_backend=whisper_backend,
         whisper_model=str(whisper_model).strip(),
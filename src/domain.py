@@ -1,7 +1,8 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any, List
+from dataclasses import dataclass, field
+from functools import cached_property, lru_cache
+from typing import Any, Iterable, Iterator, List, Optional, Tuple
 import re
 
 
@@ -10,7 +11,7 @@ import re
 # -----------------------
 
 
-@dataclass
+@dataclass(slots=True)
 class TranscriptWord:
     """Single word with timing and confidence."""
 
@@ -20,6 +21,7 @@ class TranscriptWord:
     confidence: float
 
 
+# Not slotted: `text_lower` is a cached_property, which stores into __dict__.
 @dataclass
 class TranscriptSegment:
     """A contiguous chunk of recognized speech."""
@@ -32,18 +34,26 @@ class TranscriptSegment:
     avg_confidence: float
     chunk_index: int
 
+    @cached_property
+    def text_lower(self) -> str:
+        """Lowercased `text`, computed once and shared by all term lookups."""
+        return self.text.lower()
 
-@dataclass
+
+@dataclass(slots=True)
 class TranscriptionResult:
     """
     Aggregated transcription for a full audio source.
 
     raw_responses can carry provider-specific metadata for debugging.
+    failed_chunks counts chunks that could not be transcribed; a non-zero
+    value means the transcript is incomplete.
     """
 
     segments: List[TranscriptSegment]
     language: str
     raw_responses: List[dict[str, Any]]
+    failed_chunks: int = 0
 
 
 # -----------------------
@@ -51,24 +61,132 @@ class TranscriptionResult:
 # -----------------------
 
 
-@dataclass
+@dataclass(slots=True)
 class ProfanityTerm:
     """Canonical profanity term (normalized to lowercase)."""
 
     text: str  # canonical lowercase form
 
-    @property
-    def pattern(self) -> re.Pattern[str]:
+    # Compiled regex for this term with word boundaries. Built once when the
+    # term is constructed so hot loops never pay the compile (or re-cache
+    # lookup) cost. Kept here so word-boundary matching lives on the domain
+    # model rather than being duplicated in callers.
+    pattern: re.Pattern[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.pattern = re.compile(rf"\b{re.escape(self.text)}\b", re.IGNORECASE)
+
+    @classmethod
+    def build_union(cls, terms: Iterable["ProfanityTerm"]) -> re.Pattern[str]:
         """
-        Compiled regex for this term with word boundaries.
+        One compiled pattern matching any of `terms` with word boundaries.
 
-        Kept here so profanity-related behaviour (word-boundary matching)
-        lives on the domain model rather than being duplicated in callers.
+        Scanning with the union costs one pass per text instead of one per term.
         """
-        return re.compile(rf"\b{re.escape(self.text)}\b", re.IGNORECASE)
+        return build_matcher(t.text for t in terms).regex
 
 
-@dataclass
+@dataclass(frozen=True)
+class ProfanityMatcher:
+    """
+    Single-pass matcher for a whole set of profanity terms.
+
+    All terms are compiled into one word-bounded alternation, so a segment is
+    scanned once regardless of how many terms are configured. Longer terms are
+    tried first, so "fucking" wins over "fuck" at the same position.
+
+    When the optional `pyahocorasick` package is installed, `iter_matches`
+    scans with an Aho-Corasick automaton (C code, O(text + matches)) instead,
+    with the same word-boundary and leftmost-longest semantics. `regex` is
+    always available for substitution (e.g. subtitle masking).
+    """
+
+    terms: Tuple[str, ...]
+    regex: re.Pattern[str]
+    automaton: Any = field(default=None, repr=False, compare=False)
+
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, int, str]]:
+        """Yield `(start, end, term)` for each non-overlapping match in `text`."""
+        if self.automaton is not None:
+            folded = text.lower()
+            # Lowercasing can change length for a few non-ASCII characters;
+            # offsets would then be wrong, so use the regex for those texts.
+            if len(folded) == len(text):
+                yield from _iter_automaton_matches(self.automaton, folded)
+                return
+        for match in self.regex.finditer(text):
+            yield match.start(), match.end(), match.group(0).lower()
+
+
+def _is_word_char(ch: str) -> bool:
+    return ch.isalnum() or ch == "_"
+
+
+def _is_word_boundary(text: str, pos: int) -> bool:
+    """Same rule as regex `\\b`: word-ness differs on either side of `pos`."""
+    before = pos > 0 and _is_word_char(text[pos - 1])
+    after = pos < len(text) and _is_word_char(text[pos])
+    return before != after
+
+
+def _iter_automaton_matches(automaton: Any, text: str) -> Iterator[Tuple[int, int, str]]:
+    candidates = []
+    for end_index, term in automaton.iter(text):
+        start = end_index - len(term) + 1
+        end = end_index + 1
+        if _is_word_boundary(text, start) and _is_word_boundary(text, end):
+            candidates.append((start, end, term))
+
+    # The automaton reports every (overlapping) match; keep leftmost-longest,
+    # non-overlapping ones, exactly like the regex alternation.
+    candidates.sort(key=lambda m: (m[0], -m[1]))
+    last_end = -1
+    for start, end, term in candidates:
+        if start >= last_end:
+            yield start, end, term
+            last_end = end
+
+
+def build_matcher(terms: Iterable[str]) -> ProfanityMatcher:
+    """
+    Return a (cached) ProfanityMatcher for `terms`.
+
+    The compiled matcher is memoized on the normalized term set, so repeated
+    calls with the same list (e.g. once per run or per segment) reuse it.
+    """
+    normalized = {t.strip().lower() for t in terms}
+    normalized.discard("")
+    return _build_matcher(tuple(sorted(normalized, key=lambda t: (-len(t), t))))
+
+
+@lru_cache(maxsize=32)
+def _build_matcher(terms: Tuple[str, ...]) -> ProfanityMatcher:
+    if not terms:
+        # Never matches.
+        return ProfanityMatcher(terms=terms, regex=re.compile(r"(?!)"))
+    alternation = "|".join(re.escape(t) for t in terms)
+    return ProfanityMatcher(
+        terms=terms,
+        regex=re.compile(rf"\b(?:{alternation})\b", re.IGNORECASE),
+        automaton=_build_automaton(terms),
+    )
+
+
+def _build_automaton(terms: Tuple[str, ...]) -> Any:
+    """Return a pyahocorasick automaton for `terms`, or None if it is not installed."""
+    try:
+        import ahocorasick  # type: ignore
+    except ImportError:
+        return None
+
+    automaton = ahocorasick.Automaton()
+    for term in terms:
+        automaton.add_word(term, term)
+    automaton.make_automaton()
+    return automaton
+
+
+@dataclass(slots=True)
 class ProfanityHit:
     """
     A single profanity occurrence detected in the transcript.
@@ -83,7 +201,7 @@ class ProfanityHit:
     chunk_index: int
 
 
-@dataclass
+@dataclass(slots=True)
 class ProfanitySpan:
     """
     A merged profanity span, potentially representing several nearby hits.
@@ -93,10 +211,21 @@ class ProfanitySpan:
     end: float
     hits: List[ProfanityHit]
     max_confidence: float
+    # Index of the highest-confidence hit, filled in by merge_profanity_spans.
+    # None (hand-built spans) means "scan `hits`".
+    best_hit_index: Optional[int] = None
 
     @property
-    def representative_word(self) -> str:
+    def best_hit(self) -> Optional[ProfanityHit]:
+        """The highest-confidence hit (first one on ties), or None if empty."""
         if not self.hits:
-            return ""
+            return None
+        if self.best_hit_index is not None:
+            return self.hits[self.best_hit_index]
+        return max(self.hits, key=lambda h: h.confidence)
+
+    @property
+    def representative_word(self) -> str:
         # Highest-confidence word in the span
-        return max(self.hits, key=lambda h: h.confidence).word
\ No newline at end of file
+        best = self.best_hit
+        return best.word if best is not None else ""
\ No newline at end of file
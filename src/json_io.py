@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any
+
+try:  # Optional fast path: orjson serializes/parses in C, several times faster.
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None  # type: ignore[assignment]
+
+
+def write_json(path: Path, data: Any) -> None:
+    """
+    Write `data` to `path` as UTF-8 JSON indented by two spaces.
+
+    Uses orjson when installed, else the stdlib `json` module; both produce
+    the same layout (non-ASCII text is written as-is, not escaped).
+    """
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        return
+
+    with path.open("w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+
+
+def read_json(path: Path) -> Any:
+    """Parse the JSON document at `path` (orjson when installed)."""
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+
+    with path.open("r", encoding="utf-8") as f:
+        return json.load(f)
@@ -1,14 +1,18 @@
 from __future__ import annotations
 
 import argparse
+import hashlib
+import json
 import logging
+import os
 import sys
 from pathlib import Path
+from typing import Iterable
 from tempfile import TemporaryDirectory
-import shutil
 
-from .audio_tools import chunk_audio, extract_mono_pcm_audio
+from .audio_tools import AudioChunk, extract_and_chunk, stream_pcm_chunks
 from .config import AppConfig, load_config_from_args
+from .domain import TranscriptionResult
 from .profanity_detector import (
     build_censor_log,
     build_subtitles,
@@ -17,11 +21,13 @@ from .profanity_detector import (
     merge_profanity_spans,
 )
 from .transcriber import (
+    _normalize_model_for_backend,
     build_clean_transcript,
+    load_transcript_json,
     save_transcript_json,
     transcribe_audio_chunks,
 )
-from .video_tools import apply_audio_filters_and_mux, input_has_clean_track_marker
+from .video_tools import apply_audio_filters_and_mux, input_has_clean_track_marker, link_or_copy
 
 logger = logging.getLogger(__name__)
 
@@ -59,6 +65,13 @@ def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
         help="Length of audio chunks in seconds for transcription (default: 300).",
     )
 
+    parser.add_argument(
+        "--chunk-workers",
+        type=int,
+        default=None,
+        help="Number of audio chunks to transcribe concurrently (default: automatic).",
+    )
+
     parser.add_argument(
         "--bleep-sound-path",
         help="Optional WAV beep file (currently unused; synthetic tone is used instead).",
@@ -136,6 +149,48 @@ def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
         ),
     )
 
+    parser.add_argument(
+        "--no-transcript-cache",
+        dest="transcript_cache",
+        action="store_false",
+        default=None,
+        help=(
+            "Always re-transcribe instead of reusing a cached transcript from "
+            "<output-dir>/transcript_cache for an unchanged input."
+        ),
+    )
+
+    parser.add_argument(
+        "--force-remux",
+        action="store_true",
+        default=None,
+        help=(
+            "Remux through ffmpeg even when nothing needs censoring. By default such "
+            "inputs are copied to the output path unchanged."
+        ),
+    )
+
+    parser.add_argument(
+        "--hardlink-output",
+        action="store_true",
+        default=None,
+        help=(
+            "When nothing needs censoring, hard-link the input to the output path instead "
+            "of copying it. The output then shares the input's inode, so editing one in "
+            "place changes the other."
+        ),
+    )
+
+    parser.add_argument(
+        "--aac-splice",
+        action="store_true",
+        default=None,
+        help=(
+            "In mute mode, splice silent frames into an AAC primary track instead of "
+            "re-encoding it (experimental; requires PyAV)."
+        ),
+    )
+
     return parser.parse_args(argv)
 
 
@@ -148,6 +203,184 @@ def setup_logging(verbose: bool) -> None:
     )
 
 
+_MB = 1024 * 1024
+
+# Bump when the cached transcript format or its key changes.
+_TRANSCRIPT_CACHE_VERSION = 1
+
+# Approximate resident size of one loaded local Whisper model, per model name.
+_LOCAL_WHISPER_MODEL_BYTES = {
+    "tiny": 75 * _MB,
+    "base": 142 * _MB,
+    "small": 466 * _MB,
+    "medium": 1536 * _MB,
+    "large": 3072 * _MB,
+}
+
+# Upper bound of the default number of chunks in flight (one per CPU, at most
+# this many) when --chunk-workers / CHUNK_WORKERS is unset.
+_MAX_DEFAULT_CHUNK_WORKERS = 8
+
+
+def _available_cpus() -> int:
+    # Respect CPU affinity (taskset, cgroups cpusets) where the platform exposes it.
+    if hasattr(os, "sched_getaffinity"):
+        return max(1, len(os.sched_getaffinity(0)))
+    return max(1, os.cpu_count() or 1)
+
+
+def _available_memory_bytes() -> int | None:
+    try:
+        import psutil  # type: ignore
+    except ImportError:
+        pass
+    else:
+        return int(psutil.virtual_memory().available)
+
+    try:
+        return os.sysconf("SC_AVPHYS_PAGES") * os.sysconf("SC_PAGE_SIZE")
+    except (AttributeError, ValueError, OSError):
+        # Not available on this platform (e.g. macOS without psutil).
+        return None
+
+
+def effective_workers(config: AppConfig) -> int:
+    """
+    Number of chunks to transcribe concurrently.
+
+    Defaults to one worker per CPU, at most eight. Remote backends are
+    network-bound, so that value (or the configured one) is used as-is. For
+    local Whisper every worker may hold a model in RAM, so the count is also
+    capped by usable CPUs and by available memory divided by the model
+    footprint, to avoid over-subscribing the machine.
+    """
+    workers = config.chunk_workers or min(_MAX_DEFAULT_CHUNK_WORKERS, os.cpu_count() or 1)
+    if config.whisper_backend != "local_whisper":
+        return max(1, workers)
+
+    workers = min(workers, _available_cpus())
+
+    available = _available_memory_bytes()
+    if available is not None:
+        # Resolve aliases (e.g. "whisper-1") to the model local Whisper will load.
+        model = _normalize_model_for_backend(config.whisper_model, "local_whisper")
+        footprint = _LOCAL_WHISPER_MODEL_BYTES.get(
+            model.split(".")[0].split("-")[0],
+            _LOCAL_WHISPER_MODEL_BYTES["large"],
+        )
+        workers = min(workers, available // footprint)
+
+    return max(1, workers)
+
+
+def _transcribe_input(config: AppConfig, tmpdir: Path) -> TranscriptionResult:
+    """Extract audio from the input in chunks and transcribe it."""
+    logger.info(
+        "Extracting mono PCM audio in %s-second chunks and transcribing with Whisper backend '%s'...",
+        config.chunk_length_seconds,
+        config.whisper_backend,
+    )
+
+    # Chunks are yielded while ffmpeg is still decoding, so transcription of
+    # early chunks overlaps extraction of later ones.
+    if config.debug_dump_audio:
+        # Debug path: write audio.wav and chunk WAVs so they can be inspected.
+        # The full audio is written straight into output_dir/audio_debug by the
+        # same ffmpeg run that produces the chunks.
+        debug_dir = config.output_dir / "audio_debug"
+        chunks_dir = tmpdir / "chunks"
+        chunks_dir.mkdir(parents=True, exist_ok=True)
+        chunks: Iterable[AudioChunk] = extract_and_chunk(
+            config.input_path,
+            chunks_dir,
+            config.chunk_length_seconds,
+            sample_rate=16000,
+            debug_audio_path=debug_dir / "audio.wav",
+        )
+    else:
+        # Fast path: PCM is streamed from ffmpeg's stdout; no chunk files on disk.
+        chunks = stream_pcm_chunks(
+            config.input_path,
+            config.chunk_length_seconds,
+            sample_rate=16000,
+        )
+
+    transcription_result = transcribe_audio_chunks(
+        chunks,
+        config,
+        max_workers=effective_workers(config),
+    )
+
+    # Optional debug: copy the chunks next to audio.wav in output_dir/audio_debug
+    if config.debug_dump_audio:
+        try:
+            for chunk_path in sorted(chunks_dir.glob("chunk_*.wav")):
+                link_or_copy(chunk_path, debug_dir / chunk_path.name, hardlink=True)
+            logger.info("Debug audio dumped to %s", debug_dir)
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("Failed to copy debug audio files: %s", exc)
+
+    return transcription_result
+
+
+def _transcript_cache_path(config: AppConfig) -> Path | None:
+    """
+    Cache file for this input + transcription settings, or None if caching is off.
+
+    The key covers the input's identity (resolved path, size, mtime) and every
+    setting that changes the transcript. Detection settings (terms, confidence,
+    gap, mode) are deliberately excluded: re-running with different ones reuses
+    the transcript.
+    """
+    if not config.transcript_cache:
+        return None
+    try:
+        st = config.input_path.stat()
+    except OSError:
+        return None
+
+    key = json.dumps(
+        [
+            _TRANSCRIPT_CACHE_VERSION,
+            str(config.input_path),
+            st.st_size,
+            st.st_mtime_ns,
+            config.whisper_backend,
+            config.whisper_model,
+            config.audio_language,
+            config.chunk_length_seconds,
+        ]
+    )
+    digest = hashlib.sha256(key.encode("utf-8")).hexdigest()[:16]
+    return config.output_dir / "transcript_cache" / f"{config.input_path.stem}-{digest}.json"
+
+
+def _load_cached_transcript(config: AppConfig) -> TranscriptionResult | None:
+    cache_path = _transcript_cache_path(config)
+    # --debug-dump-audio asks for the extracted audio, so always run extraction.
+    if cache_path is None or config.debug_dump_audio or not cache_path.exists():
+        return None
+    try:
+        result = load_transcript_json(cache_path)
+    except (OSError, ValueError, KeyError, TypeError) as exc:
+        logger.warning("Ignoring unreadable transcript cache %s: %s", cache_path, exc)
+        return None
+    logger.info("Reusing cached transcript from %s", cache_path)
+    return result
+
+
+def _store_cached_transcript(config: AppConfig, result: TranscriptionResult) -> None:
+    cache_path = _transcript_cache_path(config)
+    if cache_path is None:
+        return
+    tmp_path = cache_path.with_suffix(".json.tmp")
+    try:
+        save_transcript_json(result, tmp_path)
+        os.replace(tmp_path, cache_path)
+    except OSError as exc:
+        logger.warning("Failed to write transcript cache %s: %s", cache_path, exc)
+
+
 def run_pipeline(config: AppConfig) -> None:
     """
     Execute the full profanity-stripping pipeline end-to-end.
@@ -173,34 +406,17 @@ def run_pipeline(config: AppConfig) -> None:
 
     with TemporaryDirectory(prefix="profanity_pipeline_") as tmpdir_str:
         tmpdir = Path(tmpdir_str)
-        audio_path = tmpdir / "audio.wav"
-
-        logger.info("Extracting mono PCM audio...")
-        extract_mono_pcm_audio(config.input_path, audio_path, sample_rate=16000)
 
-        logger.info("Chunking audio into %s-second segments...", config.chunk_length_seconds)
-        chunks_dir = tmpdir / "chunks"
-        chunks_dir.mkdir(parents=True, exist_ok=True)
-        chunks = chunk_audio(audio_path, config.chunk_length_seconds, chunks_dir)
-
-        # Optional debug: copy the extracted audio and chunks to output_dir/audio_debug
-        if getattr(config, "debug_dump_audio", False):
-            debug_dir = config.output_dir / "audio_debug"
-            debug_dir.mkdir(parents=True, exist_ok=True)
-            try:
-                shutil.copy2(audio_path, debug_dir / "audio.wav")
-                for chunk in chunks:
-                    shutil.copy2(chunk.path, debug_dir / chunk.path.name)
-                logger.info("Debug audio dumped to %s", debug_dir)
-            except Exception as exc:  # noqa: BLE001
-                logger.warning("Failed to copy debug audio files: %s", exc)
-
-        logger.info(
-            "Transcribing %d audio chunks with Whisper backend '%s'...",
-            len(chunks),
-            getattr(config, "whisper_backend", "unknown"),
-        )
-        transcription_result = transcribe_audio_chunks(chunks, config)
+        transcription_result = _load_cached_transcript(config)
+        if transcription_result is None:
+            transcription_result = _transcribe_input(config, tmpdir)
+            if transcription_result.failed_chunks:
+                logger.warning(
+                    "%d chunk(s) failed to transcribe; not caching the incomplete transcript.",
+                    transcription_result.failed_chunks,
+                )
+            else:
+                _store_cached_transcript(config, transcription_result)
 
         logger.info("Detected language: %s", transcription_result.language)
 
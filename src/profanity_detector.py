@@ -1,19 +1,21 @@
 from __future__ import annotations
 
-import json
 import logging
 import re
+from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+from typing import Any, Dict, FrozenSet, List, Optional, Sequence, Tuple
 
 from .config import AppConfig
+from .json_io import write_json
 from .domain import (
     TranscriptSegment,
-    TranscriptWord,
     TranscriptionResult,
     ProfanityTerm,
     ProfanityHit,
     ProfanitySpan,
+    build_matcher,
 )
 
 logger = logging.getLogger(__name__)
@@ -22,18 +24,32 @@ logger = logging.getLogger(__name__)
 def load_profanity_terms(config: AppConfig) -> List[ProfanityTerm]:
     """
     Convert config.profanity_terms list of strings into ProfanityTerm objects.
+
+    AppConfig has already stripped, lowercased and de-duplicated the terms.
+    The ProfanityTerm objects (each with a compiled pattern) are cached per
+    term list; every call gets its own list of the shared terms.
     """
-    terms: List[ProfanityTerm] = []
-    for w in config.profanity_terms:
-        w = w.strip().lower()
-        if not w:
-            continue
-        terms.append(ProfanityTerm(text=w))
-    return terms
+    return list(_load_terms_tuple(tuple(config.profanity_terms)))
+
+
+@lru_cache(maxsize=8)
+def _load_terms_tuple(terms: Tuple[str, ...]) -> Tuple[ProfanityTerm, ...]:
+    return tuple(ProfanityTerm(text=w) for w in terms)
+
+
+# ASCII characters outside `[\w']`; deleting them with str.translate is the
+# common-case equivalent of re.sub(r"[^\w']+", "", ...) without regex dispatch.
+_ASCII_NON_TOKEN_CHARS = str.maketrans(
+    "", "", "".join(c for c in map(chr, range(128)) if not (c.isalnum() or c in "_'"))
+)
 
 
 def _token_normalize(word: str) -> str:
-    return re.sub(r"[^\w']+", "", word.lower())
+    token = word.lower().translate(_ASCII_NON_TOKEN_CHARS)
+    if token.isascii():
+        return token
+    # Rare non-ASCII leftovers: apply the same `\w` rule (alphanumeric or `_`).
+    return "".join(ch for ch in token if ch.isalnum() or ch in "_'")
 
 
 def detect_profanity(
@@ -59,88 +75,96 @@ def detect_profanity(
         logger.warning("Profanity detection called with empty term list.")
         return hits
 
+    # One combined matcher for the segment-text fallback, built once per term set.
+    matcher = build_matcher(t.text for t in profanity_terms)
+
+    min_confidence = config.min_confidence
+    drop_low_confidence = config.mode != "mute"
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
+
+    append_hit = hits.append
     for seg in transcription.segments:
-        seg_text_lower = seg.text.lower()
         context_text = seg.text.strip()
-
-        # Build a map from normalized word -> list of (TranscriptWord, original word text)
-        word_candidates: List[Tuple[TranscriptWord, str]] = []
-        if seg.words:
-            for w in seg.words:
-                norm = _token_normalize(w.word)
-                if not norm:
-                    continue
-                word_candidates.append((w, norm))
+        seg_id = seg.id
+        chunk_index = seg.chunk_index
 
         # Primary path: use word-level alignment
-        for w_obj, norm in word_candidates:
-            if norm in term_texts:
-                conf = float(w_obj.confidence)
-                if conf < config.min_confidence:
-                    # For mute mode, we must trust timestamps to build censor
-                    # intervals, even when the ASR word confidence is low.
-                    # Otherwise clear profanities can be missed entirely.
-                    if config.mode != "mute":
+        for w_obj in seg.words:
+            conf = float(w_obj.confidence)
+            low_confidence = conf < min_confidence
+            if low_confidence and drop_low_confidence:
+                # Cheap gate first: in non-mute modes a low-confidence word is
+                # dropped whether or not it is profane, so skip normalizing it.
+                if debug_enabled:
+                    norm = _token_normalize(w_obj.word)
+                    if norm in term_texts:
                         logger.debug(
                             "Skipping profanity token %r (conf=%.3f < min=%.3f) in mode=%s",
                             norm,
                             conf,
-                            config.min_confidence,
+                            min_confidence,
                             config.mode,
                         )
-                        continue
+                continue
+
+            norm = _token_normalize(w_obj.word)
+            if not norm or norm not in term_texts:
+                continue
+
+            if low_confidence:
+                # For mute mode, we must trust timestamps to build censor
+                # intervals, even when the ASR word confidence is low.
+                # Otherwise clear profanities can be missed entirely.
+                logger.debug(
+                    "Keeping low-confidence profanity token %r (conf=%.3f < min=%.3f) in mode=%s",
+                    norm,
+                    conf,
+                    min_confidence,
+                    config.mode,
+                )
+
+            # Positional construction: cheaper than keywords in this loop.
+            append_hit(
+                ProfanityHit(
+                    norm,
+                    float(w_obj.start),
+                    float(w_obj.end),
+                    conf,
+                    context_text,
+                    seg_id,
+                    chunk_index,
+                )
+            )
+
+        # Fallback: if no word timing present, use regex on the segment text.
+        if not seg.words:
+            for _, _, term_text in matcher.iter_matches(seg.text_lower):
+                # Map match to whole segment timing; imperfect but better than nothing.
+                conf = float(seg.avg_confidence)
+                if conf < config.min_confidence:
                     logger.debug(
-                        "Keeping low-confidence profanity token %r (conf=%.3f < min=%.3f) in mode=%s",
-                        norm,
+                        "Skipping segment-level profanity match %r (seg_avg_conf=%.3f < min=%.3f)",
+                        term_text,
                         conf,
                         config.min_confidence,
-                        config.mode,
                     )
+                    continue
 
-                hits.append(
+                append_hit(
                     ProfanityHit(
-                        word=norm,
-                        start=float(w_obj.start),
-                        end=float(w_obj.end),
-                        confidence=conf,
-                        context=context_text,
-                        segment_id=seg.id,
-                        chunk_index=seg.chunk_index,
+                        term_text,
+                        float(seg.start),
+                        float(seg.end),
+                        conf,
+                        context_text,
+                        seg_id,
+                        chunk_index,
                     )
                 )
 
-        # Fallback: if no word timing present, use regex on the segment text.
-        if not seg.words:
-            for term in profanity_terms:
-                # Pylance sometimes loses track of the `pattern` property on ProfanityTerm
-                # when imported from the shared domain module. The attribute does exist,
-                # so we silence the spurious type error here.
-                for match in term.pattern.finditer(seg_text_lower):  # type: ignore[attr-defined]
-                    # Map match to whole segment timing; imperfect but better than nothing.
-                    conf = float(seg.avg_confidence)
-                    if conf < config.min_confidence:
-                        logger.debug(
-                            "Skipping segment-level profanity match %r (seg_avg_conf=%.3f < min=%.3f)",
-                            term.text,
-                            conf,
-                            config.min_confidence,
-                        )
-                        continue
-
-                    hits.append(
-                        ProfanityHit(
-                            word=term.text,
-                            start=float(seg.start),
-                            end=float(seg.end),
-                            confidence=conf,
-                            context=context_text,
-                            segment_id=seg.id,
-                            chunk_index=seg.chunk_index,
-                        )
-                    )
-
-    # Sort hits by time for downstream merging
-    hits.sort(key=lambda h: (h.start, h.end))
+    # Sort hits by time for downstream merging. attrgetter builds the key
+    # tuple in C instead of calling a Python lambda per hit.
+    hits.sort(key=attrgetter("start", "end"))
     return hits
 
 
@@ -153,43 +177,57 @@ def merge_profanity_spans(
 
     - Overlapping timestamps are merged.
     - Spans separated by <= max_gap_ms are merged to avoid choppy censoring.
+
+    `hits` normally arrive sorted from detect_profanity; other input is
+    sorted (stably, by start) first.
     """
     if not hits:
         return []
 
-    merged: List[ProfanitySpan] = []
-
-    current_start = hits[0].start
-    current_end = hits[0].end
-    current_hits: List[ProfanityHit] = [hits[0]]
-
-    def flush() -> None:
-        if not current_hits:
-            return
-        span = ProfanitySpan(
-            start=current_start,
-            end=current_end,
-            hits=list(current_hits),
-            max_confidence=max(h.confidence for h in current_hits),
-        )
-        merged.append(span)
-
     max_gap_sec = max_gap_ms / 1000.0
 
-    for h in hits[1:]:
-        gap = h.start - current_end
-        if gap <= max_gap_sec:
-            # Extend current span
-            current_end = max(current_end, h.end)
-            current_hits.append(h)
-        else:
-            # Close current span and start a new one
-            flush()
-            current_start = h.start
-            current_end = h.end
-            current_hits = [h]
-
-    flush()
+    starts = [h.start for h in hits]
+    if any(b < a for a, b in zip(starts, starts[1:])):
+        hits = sorted(hits, key=attrgetter("start"))
+        starts = [h.start for h in hits]
+
+    # Pass 1: a tight loop over plain floats finds where each span begins
+    # (`breaks`) and how far it reaches (`span_ends`, the running max end).
+    ends = [h.end for h in hits]
+    breaks = [0]
+    span_ends: List[float] = []
+    running_end = ends[0]
+    for i in range(1, len(hits)):
+        start = starts[i]
+        if start - running_end > max_gap_sec:
+            breaks.append(i)
+            span_ends.append(running_end)
+            running_end = ends[i]
+        elif ends[i] > running_end:
+            running_end = ends[i]
+    span_ends.append(running_end)
+    breaks.append(len(hits))
+
+    # Pass 2: build one ProfanitySpan per group, tracking the best hit (first
+    # one on ties) so consumers need not rescan `hits`.
+    confidences = [h.confidence for h in hits]
+    merged: List[ProfanitySpan] = []
+    for (lo, hi), span_end in zip(zip(breaks, breaks[1:]), span_ends):
+        best = lo
+        best_conf = confidences[lo]
+        for i in range(lo + 1, hi):
+            if confidences[i] > best_conf:
+                best = i
+                best_conf = confidences[i]
+        merged.append(
+            ProfanitySpan(
+                start=starts[lo],
+                end=span_end,
+                hits=list(hits[lo:hi]),
+                max_confidence=best_conf,
+                best_hit_index=best - lo,
+            )
+        )
     return merged
 
 
@@ -215,8 +253,8 @@ def build_censor_log(
 
     for span in spans:
         # Use the most confident hit for representative context/word
-        if span.hits:
-            best_hit = max(span.hits, key=lambda h: h.confidence)
+        best_hit = span.best_hit
+        if best_hit is not None:
             word = best_hit.word
             context = best_hit.context
             confidence = best_hit.confidence
@@ -235,23 +273,30 @@ def build_censor_log(
             }
         )
 
-    with path.open("w", encoding="utf-8") as f:
-        json.dump(log_entries, f, ensure_ascii=False, indent=2)
+    write_json(path, log_entries)
 
 
 def _format_srt_timestamp(t: float) -> str:
     """
     Convert seconds to SRT timestamp: HH:MM:SS,mmm
+
+    Works in integer milliseconds: one rounding step and three divmods, and a
+    value like 1.9996 rolls over to 00:00:02,000 instead of "01,1000".
     """
-    if t < 0:
-        t = 0.0
-    hours = int(t // 3600)
-    minutes = int((t % 3600) // 60)
-    seconds = int(t % 60)
-    millis = int(round((t - int(t)) * 1000))
+    total_ms = int(round(t * 1000)) if t > 0 else 0
+    hours, rem = divmod(total_ms, 3_600_000)
+    minutes, rem = divmod(rem, 60_000)
+    seconds, millis = divmod(rem, 1000)
     return f"{hours:02d}:{minutes:02d}:{seconds:02d},{millis:03d}"
 
 
+@lru_cache(maxsize=128)
+def _mask_regex(words: FrozenSet[str]) -> re.Pattern[str]:
+    """Case-insensitive whole-word alternation of `words`, compiled once per set."""
+    alternation = "|".join(re.escape(w) for w in sorted(words, key=len, reverse=True))
+    return re.compile(rf"\b(?:{alternation})\b", re.IGNORECASE)
+
+
 def build_subtitles(
     spans: Sequence[ProfanitySpan],
     transcript: TranscriptionResult,
@@ -265,27 +310,22 @@ def build_subtitles(
     path = path.expanduser()
     path.parent.mkdir(parents=True, exist_ok=True)
 
-    # Prepare for quick span lookup: we'll simply use the best_hit.context and mask all
-    # profanity words present in that context.
     lines: List[str] = []
     index = 1
 
     for span in spans:
-        if not span.hits:
+        best_hit = span.best_hit
+        if best_hit is None:
             continue
 
-        best_hit = max(span.hits, key=lambda h: h.confidence)
         context = best_hit.context
         if not context:
             continue
 
-        # Mask any profanity term inside context text (simple approach).
-        masked_context = context
-        for h in span.hits:
-            if not h.word:
-                continue
-            pattern = re.compile(rf"\b{re.escape(h.word)}\b", re.IGNORECASE)
-            masked_context = pattern.sub("****", masked_context)
+        # Mask only this span's own hit words: those are what was censored
+        # at this timestamp.
+        words = frozenset(h.word for h in span.hits if h.word)
+        masked_context = _mask_regex(words).sub("****", context) if words else context
 
         start_ts = _format_srt_timestamp(span.start)
         end_ts = _format_srt_timestamp(span.end)
@@ -1,26 +1,47 @@
 from __future__ import annotations
 
-import json
+import asyncio
 import logging
 import time
-from dataclasses import asdict
+from bisect import bisect_left
+from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Sequence
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Sized, Tuple
 
 from .audio_tools import AudioChunk
 from .config import AppConfig
+from .json_io import read_json, write_json
 from .domain import TranscriptWord, TranscriptSegment, TranscriptionResult
 
 from .transcription_backends.local_whisper import (
     transcribe_audio as _local_whisper_transcribe_audio,
 )
 from .transcription_backends.openai_api import (
+    new_async_client as _openai_api_new_async_client,
     transcribe_audio as _openai_api_transcribe_audio,
+    transcribe_audio_async as _openai_api_transcribe_audio_async,
 )
 
 logger = logging.getLogger(__name__)
 
 
+# Local Whisper size names; see `_normalize_model_for_backend`.
+_LOCAL_WHISPER_SIZES = frozenset(
+    {
+        "tiny",
+        "base",
+        "small",
+        "medium",
+        "large",
+        "large-v1",
+        "large-v2",
+        "large-v3",
+    }
+)
+
+
+@lru_cache(maxsize=32)
 def _normalize_model_for_backend(model: str, backend: str) -> str:
     """Normalize user-facing model names to backend-specific identifiers.
 
@@ -42,16 +63,7 @@ def _normalize_model_for_backend(model: str, backend: str) -> str:
     # backend == openai_api
     # OpenAI's transcription endpoint does not accept local-whisper size names.
     # If the user used a local size name, fall back to OpenAI's whisper-1.
-    if m.lower() in {
-        "tiny",
-        "base",
-        "small",
-        "medium",
-        "large",
-        "large-v1",
-        "large-v2",
-        "large-v3",
-    }:
+    if m.lower() in _LOCAL_WHISPER_SIZES:
         return "whisper-1"
 
     return m
@@ -65,89 +77,149 @@ def _parse_transcript_response(
     """
     Convert a verbose_json transcription into TranscriptSegment objects.
 
+    Used for both backends: local Whisper results share the layout, so they
+    are parsed here in one pass rather than first rewritten into API shape.
+
     Timestamps from the API are relative to the chunk; we convert to absolute
     by adding chunk.start_time.
+
+    Both backends emit numeric fields, so values are converted directly. A
+    word with a malformed value is logged and skipped on its own; a segment
+    whose own timing or id is malformed is skipped as a whole.
     """
     language = str(raw.get("language") or "unknown")
 
+    # Bound locally: this loop runs once per word of the transcript.
+    _float = float
+    _str = str
+    _Word = TranscriptWord
+    offset = chunk.start_time
+
     segments_out: List[TranscriptSegment] = []
-    segments_data = raw.get("segments") or []
+    append_segment = segments_out.append
 
-    for seg in segments_data:
+    for seg in raw.get("segments") or ():
+        get = seg.get
         try:
-            seg_start_rel = float(seg.get("start", 0.0))
-        except Exception:
-            seg_start_rel = 0.0
-        try:
-            seg_end_rel = float(seg.get("end", seg_start_rel))
-        except Exception:
-            seg_end_rel = seg_start_rel
-
-        seg_start = seg_start_rel + chunk.start_time
-        seg_end = seg_end_rel + chunk.start_time
+            seg_start_rel = _float(get("start") or 0.0)
+            end_val = get("end")
+            seg_end_rel = _float(end_val) if end_val is not None else seg_start_rel
+            segment_id = int(get("id", len(segments_out)))
+            seg_conf = get("confidence")
+            seg_conf = _float(seg_conf) if seg_conf is not None else 1.0
+        except (TypeError, ValueError) as exc:
+            logger.warning(
+                "Skipping malformed segment in chunk %s: %s", chunk_index, exc
+            )
+            continue
 
         words_out: List[TranscriptWord] = []
-        confidences: List[float] = []
+        append_word = words_out.append
+        conf_sum = 0.0
 
-        words_data = seg.get("words") or []
-        for w in words_data:
-            w_text = str(w.get("word", "")).strip()
+        for w in get("words") or ():
+            w_get = w.get
+            w_text = _str(w_get("word", "")).strip()
             if not w_text:
                 continue
 
+            # Only this word is dropped on a bad value, so the rest of the
+            # segment is still checked for profanity.
             try:
-                w_start_rel = float(w.get("start", seg_start_rel))
-            except Exception:
-                w_start_rel = seg_start_rel
-            try:
-                w_end_rel = float(w.get("end", w_start_rel))
-            except Exception:
-                w_end_rel = w_start_rel
-
-            conf_val = w.get("confidence")
-            if conf_val is None:
-                # Some models do not expose confidences yet; default to 1.0.
-                w_conf = 1.0
-            else:
-                try:
-                    w_conf = float(conf_val)
-                except Exception:
-                    w_conf = 1.0
-
-            confidences.append(w_conf)
-
-            words_out.append(
-                TranscriptWord(
-                    word=w_text,
-                    start=w_start_rel + chunk.start_time,
-                    end=w_end_rel + chunk.start_time,
-                    confidence=w_conf,
+                start_val = w_get("start")
+                w_start_rel = _float(start_val) if start_val is not None else seg_start_rel
+                end_val = w_get("end")
+                w_end_rel = _float(end_val) if end_val is not None else w_start_rel
+
+                # Local `whisper` reports `probability`; some models expose
+                # no confidence at all, which defaults to 1.0.
+                conf_val = w_get("confidence")
+                if conf_val is None:
+                    conf_val = w_get("probability")
+                w_conf = _float(conf_val) if conf_val is not None else 1.0
+            except (TypeError, ValueError) as exc:
+                logger.warning(
+                    "Skipping malformed word %r in chunk %s: %s", w_text, chunk_index, exc
                 )
-            )
+                continue
+            conf_sum += w_conf
 
-        if confidences:
-            avg_conf = sum(confidences) / len(confidences)
-        else:
-            seg_conf = seg.get("confidence", 1.0)
-            try:
-                avg_conf = float(seg_conf)
-            except Exception:
-                avg_conf = 1.0
-
-        segment = TranscriptSegment(
-            id=int(seg.get("id", len(segments_out))),
-            start=seg_start,
-            end=seg_end,
-            text=str(seg.get("text", "")).strip(),
-            words=words_out,
-            avg_confidence=avg_conf,
-            chunk_index=chunk_index,
+            append_word(_Word(w_text, w_start_rel + offset, w_end_rel + offset, w_conf))
+
+        avg_conf = conf_sum / len(words_out) if words_out else seg_conf
+
+        append_segment(
+            TranscriptSegment(
+                id=segment_id,
+                start=seg_start_rel + offset,
+                end=seg_end_rel + offset,
+                text=_str(get("text", "")).strip(),
+                words=words_out,
+                avg_confidence=avg_conf,
+                chunk_index=chunk_index,
+            )
         )
-        segments_out.append(segment)
 
     return language, segments_out
 
 
+def _models_to_try(
+    config: AppConfig,
+    backend: str,
+    primary_model: str | None,
+    fallback_model: str | None,
+) -> Sequence[str]:
+    """Primary then fallback model for a chunk, normalized for `backend`."""
+    # If not overridden per-call, use config (CLI > env > defaults).
+    configured_model = str(getattr(config, "whisper_model", "base") or "base")
+    effective_primary = primary_model if primary_model is not None else configured_model
+    effective_fallback = fallback_model if fallback_model is not None else effective_primary
+
+    return (
+        _normalize_model_for_backend(effective_primary, backend),
+        _normalize_model_for_backend(effective_fallback, backend),
+    )
+
+
+def _chunk_result(
+    raw: Dict[str, Any],
+    chunk: AudioChunk,
+    model: str,
+    fallback_model: str | None,
+) -> Optional[Dict[str, Any]]:
+    """Parse one backend response; None means "retry with the fallback model"."""
+    language, segments = _parse_transcript_response(raw, chunk, chunk.index)
+
+    # If model reports unknown language, try fallback if available.
+    if language == "unknown" and model != fallback_model:
+        logger.warning(
+            "Chunk %s returned unknown language with model %s; "
+            "will retry with fallback model.",
+            chunk.index,
+            model,
+        )
+        return None
+
+    return {
+        "chunk_index": chunk.index,
+        "language": language,
+        "segments": segments,
+        "raw": raw,
+    }
+
+
+def _backend_transcribe_fn(backend: str) -> Callable[..., Dict[str, Any]]:
+    """
+    The sync transcribe function for `backend`.
+
+    Looked up from this module's globals at call time (not cached), so tests
+    can monkeypatch `_local_whisper_transcribe_audio` / `_openai_api_transcribe_audio`.
+    """
+    if backend == "local_whisper":
+        return _local_whisper_transcribe_audio
+    return _openai_api_transcribe_audio
+
+
 def transcribe_chunk(
     chunk: AudioChunk,
     config: AppConfig,
@@ -174,19 +246,14 @@ def transcribe_chunk(
         }
     """
     backend = getattr(config, "whisper_backend", "openai_api")
-
-    # If not overridden per-call, use config (CLI > env > defaults).
-    configured_model = str(getattr(config, "whisper_model", "base") or "base")
-    effective_primary = primary_model if primary_model is not None else configured_model
-    effective_fallback = fallback_model if fallback_model is not None else effective_primary
-
-    effective_primary = _normalize_model_for_backend(effective_primary, backend)
-    effective_fallback = _normalize_model_for_backend(effective_fallback, backend)
-
-    models_to_try: Sequence[str] = (effective_primary, effective_fallback)
+    # Resolved once per chunk, not per model/attempt.
+    transcribe_fn = _backend_transcribe_fn(backend)
+    language = config.audio_language
+    # In-memory chunks (see stream_pcm_chunks) carry WAV bytes instead of a path.
+    audio = chunk.data if chunk.data is not None else chunk.path
 
     last_err: Optional[Exception] = None
-    for model in models_to_try:
+    for model in _models_to_try(config, backend, primary_model, fallback_model):
         for attempt in range(1, max_retries + 1):
             try:
                 logger.info(
@@ -196,37 +263,12 @@ def transcribe_chunk(
                     attempt,
                     max_retries,
                 )
-                if backend == "local_whisper":
-                    raw = _local_whisper_transcribe_audio(
-                        chunk.path,
-                        language=config.audio_language,
-                        model=model,
-                    )
-                else:
-                    raw = _openai_api_transcribe_audio(
-                        chunk.path,
-                        language=config.audio_language,
-                        model=model,
-                    )
-
-                language, segments = _parse_transcript_response(raw, chunk, chunk.index)
-
-                # If model reports unknown language, try fallback if available.
-                if language == "unknown" and model != fallback_model:
-                    logger.warning(
-                        "Chunk %s returned unknown language with model %s; "
-                        "will retry with fallback model.",
-                        chunk.index,
-                        model,
-                    )
-                    break
+                raw = transcribe_fn(audio, language=language, model=model)
 
-                return {
-                    "chunk_index": chunk.index,
-                    "language": language,
-                    "segments": segments,
-                    "raw": raw,
-                }
+                result = _chunk_result(raw, chunk, model, fallback_model)
+                if result is None:
+                    break
+                return result
             except Exception as exc:  # noqa: BLE001
                 last_err = exc
                 logger.warning(
@@ -248,20 +290,206 @@ def transcribe_chunk(
     )
 
 
+async def transcribe_chunk_async(
+    chunk: AudioChunk,
+    config: AppConfig,
+    client: Any,
+    primary_model: str | None = None,
+    fallback_model: str | None = None,
+    max_retries: int = 3,
+    retry_delay: float = 2.0,
+) -> Dict[str, Any]:
+    """
+    Async counterpart of `transcribe_chunk` for the OpenAI API backend.
+
+    Same retry/fallback behavior and return shape; requests go through the
+    caller's shared AsyncOpenAI `client`.
+    """
+    last_err: Optional[Exception] = None
+    for model in _models_to_try(config, "openai_api", primary_model, fallback_model):
+        for attempt in range(1, max_retries + 1):
+            try:
+                logger.info(
+                    "Transcribing chunk %s with model %s (attempt %s/%s)",
+                    chunk.index,
+                    model,
+                    attempt,
+                    max_retries,
+                )
+                audio = chunk.data if chunk.data is not None else chunk.path
+                raw = await _openai_api_transcribe_audio_async(
+                    audio,
+                    language=config.audio_language,
+                    model=model,
+                    client=client,
+                )
+
+                result = _chunk_result(raw, chunk, model, fallback_model)
+                if result is None:
+                    break
+                return result
+            except Exception as exc:  # noqa: BLE001
+                last_err = exc
+                logger.warning(
+                    "Transcription failed for chunk %s with model %s on attempt %s/%s: %s",
+                    chunk.index,
+                    model,
+                    attempt,
+                    max_retries,
+                    exc,
+                )
+                if attempt < max_retries:
+                    await asyncio.sleep(retry_delay)
+
+    raise RuntimeError(
+        f"Transcription failed for chunk {chunk.index} after retries: {last_err}"
+    )
+
+
+def _parent_logging_setup() -> Tuple[int, Optional[str]]:
+    """The root logger's level and first handler format, to replay in worker processes."""
+    root = logging.getLogger()
+    fmt = next((h.formatter._fmt for h in root.handlers if h.formatter is not None), None)
+    return root.level, fmt
+
+
+def _init_worker_logging(level: int, fmt: Optional[str]) -> None:
+    """ProcessPool initializer: log like the parent (spawned workers start unconfigured)."""
+    logging.basicConfig(level=level, format=fmt or logging.BASIC_FORMAT, force=True)
+
+
+def _chunk_executor(config: AppConfig, max_workers: int) -> Any:
+    """
+    Pick the worker pool for chunk transcription.
+
+    Local Whisper inference is CPU-bound and each model serializes its own
+    `transcribe` calls (see `local_whisper._get_transcribe_lock`), so threads
+    give no parallelism there. Fan out across processes instead; each worker
+    process lazily loads its own model copy. Remote API calls are I/O-bound
+    and stay on threads. A single local worker also stays in-process, which
+    keeps the loaded model cached across runs. Worker processes replay the
+    parent's logging level and format, so backend warnings are not lost.
+    """
+    from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+    backend = getattr(config, "whisper_backend", "openai_api")
+    if backend == "local_whisper" and max_workers > 1:
+        import multiprocessing
+
+        # "spawn" rather than fork: PyTorch state does not survive fork safely.
+        return ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker_logging,
+            initargs=_parent_logging_setup(),
+        )
+    return ThreadPoolExecutor(max_workers=max_workers)
+
+
+def _transcribe_chunks_in_pool(
+    chunks: Iterable[AudioChunk],
+    config: AppConfig,
+    max_workers: int,
+) -> Tuple[Dict[int, Dict[str, Any]], int]:
+    """
+    Run `transcribe_chunk` over a worker pool.
+
+    Returns the results keyed by chunk index and the number of failed chunks.
+    """
+    from concurrent.futures import FIRST_COMPLETED, wait
+
+    # Bound the number of submitted-but-unfinished chunks. Extraction is much
+    # faster than transcription, and in-memory chunks hold their PCM until
+    # transcribed, so this applies backpressure to the producer.
+    max_in_flight = 2 * max_workers
+
+    results_by_index: Dict[int, Dict[str, Any]] = {}
+    pending: Dict[Any, AudioChunk] = {}
+    failed = 0
+
+    def collect(done: Iterable[Any]) -> None:
+        nonlocal failed
+        for future in done:
+            chunk = pending.pop(future)
+            try:
+                results_by_index[chunk.index] = future.result()
+            except Exception as exc:  # noqa: BLE001
+                failed += 1
+                logger.error("Failed to transcribe chunk %s: %s", chunk.index, exc)
+
+    with _chunk_executor(config, max_workers) as executor:
+        for chunk in chunks:
+            if len(pending) >= max_in_flight:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                collect(done)
+            pending[executor.submit(transcribe_chunk, chunk, config)] = chunk
+
+        done, _ = wait(pending)
+        collect(done)
+
+    return results_by_index, failed
+
+
+async def _transcribe_chunks_async(
+    chunks: Iterable[AudioChunk],
+    config: AppConfig,
+    max_workers: int,
+) -> Tuple[Dict[int, Dict[str, Any]], int]:
+    """
+    Submit chunks to the OpenAI API concurrently on one event loop.
+
+    At most `max_workers` requests are in flight, all sharing one AsyncOpenAI
+    client. The next chunk is pulled from `chunks` on a worker thread (a lazy
+    producer may block on ffmpeg) and waits for a free slot, so the producer
+    runs at most one chunk ahead of the requests. Returns the results keyed by
+    chunk index and the number of failed chunks.
+    """
+    results_by_index: Dict[int, Dict[str, Any]] = {}
+    sem = asyncio.Semaphore(max_workers)
+    chunk_iter = iter(chunks)
+    failed = 0
+
+    async def run_one(chunk: AudioChunk, client: Any) -> None:
+        nonlocal failed
+        try:
+            results_by_index[chunk.index] = await transcribe_chunk_async(chunk, config, client)
+        except Exception as exc:  # noqa: BLE001
+            failed += 1
+            logger.error("Failed to transcribe chunk %s: %s", chunk.index, exc)
+        finally:
+            sem.release()
+
+    async with _openai_api_new_async_client(max_connections=max_workers) as client:
+        tasks: List[asyncio.Task[None]] = []
+        while True:
+            chunk = await asyncio.to_thread(next, chunk_iter, None)
+            if chunk is None:
+                break
+            await sem.acquire()
+            tasks.append(asyncio.create_task(run_one(chunk, client)))
+        await asyncio.gather(*tasks)
+
+    return results_by_index, failed
+
+
 def transcribe_audio_chunks(
-    chunks: List[AudioChunk],
+    chunks: Iterable[AudioChunk],
     config: AppConfig,
     max_workers: Optional[int] = None,
 ) -> TranscriptionResult:
     """
     Transcribe all audio chunks in parallel and aggregate results.
-    """
-    from concurrent.futures import ThreadPoolExecutor, as_completed
 
-    all_segments: List[TranscriptSegment] = []
-    languages: List[str] = []
-    raw_responses: List[Dict[str, Any]] = []
+    Chunks are independent, so they are fanned out concurrently: as async
+    requests on one event loop for the OpenAI API backend, across a worker
+    pool otherwise. Results are collected per chunk index and reassembled in
+    input order. Chunks that fail are logged and skipped, and counted in
+    `failed_chunks` on the result.
 
+    `chunks` may be a lazy iterator (see `extract_and_chunk`): each chunk is
+    submitted as soon as it is produced, overlapping extraction with
+    transcription.
+    """
     # Simple heuristic for workers if not specified
     if max_workers is None:
         try:
@@ -270,26 +498,28 @@ def transcribe_audio_chunks(
             max_workers = max(1, min(8, multiprocessing.cpu_count()))
         except Exception:
             max_workers = 4
+    if isinstance(chunks, Sized):
+        max_workers = min(max_workers, len(chunks))
+    max_workers = max(1, max_workers)
 
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        future_to_chunk = {
-            executor.submit(transcribe_chunk, chunk, config): chunk for chunk in chunks
-        }
-
-        for future in as_completed(future_to_chunk):
-            chunk = future_to_chunk[future]
-            try:
-                result = future.result()
-            except Exception as exc:  # noqa: BLE001
-                logger.error("Failed to transcribe chunk %s: %s", chunk.index, exc)
-                continue
+    if getattr(config, "whisper_backend", "openai_api") == "openai_api":
+        results_by_index, failed_chunks = asyncio.run(
+            _transcribe_chunks_async(chunks, config, max_workers)
+        )
+    else:
+        results_by_index, failed_chunks = _transcribe_chunks_in_pool(chunks, config, max_workers)
 
-            languages.append(result["language"])
-            raw_responses.append(result["raw"])
-            all_segments.extend(result["segments"])
+    all_segments: List[TranscriptSegment] = []
+    languages: List[str] = []
+    raw_responses: List[Dict[str, Any]] = []
+    for index in sorted(results_by_index):
+        result = results_by_index[index]
+        languages.append(result["language"])
+        raw_responses.append(result["raw"])
+        all_segments.extend(result["segments"])
 
-    # Sort segments by time
-    all_segments.sort(key=lambda s: (s.start, s.chunk_index, s.id))
+    # Sort segments by time (chunks can overlap slightly at their edges)
+    all_segments.sort(key=attrgetter("start", "chunk_index", "id"))
 
     # Determine dominant language (first non-unknown)
     language = "unknown"
@@ -302,9 +532,31 @@ def transcribe_audio_chunks(
         segments=all_segments,
         language=language,
         raw_responses=raw_responses,
+        failed_chunks=failed_chunks,
     )
 
 
+def _segment_to_dict(seg: TranscriptSegment) -> Dict[str, Any]:
+    """
+    Flat dict for one segment, in the same key order `dataclasses.asdict` used.
+
+    Built directly rather than via `asdict`, which deep-copies every field and
+    recurses through each TranscriptWord.
+    """
+    return {
+        "id": seg.id,
+        "start": seg.start,
+        "end": seg.end,
+        "text": seg.text,
+        "words": [
+            {"word": w.word, "start": w.start, "end": w.end, "confidence": w.confidence}
+            for w in seg.words
+        ],
+        "avg_confidence": seg.avg_confidence,
+        "chunk_index": seg.chunk_index,
+    }
+
+
 def save_transcript_json(result: TranscriptionResult, path: Path) -> None:
     """
     Persist transcript (segments + words) to JSON for downstream analysis.
@@ -314,16 +566,48 @@ def save_transcript_json(result: TranscriptionResult, path: Path) -> None:
 
     data: Dict[str, Any] = {
         "language": result.language,
-        "segments": [],
+        "segments": [_segment_to_dict(seg) for seg in result.segments],
     }
 
-    for seg in result.segments:
-        seg_dict: Dict[str, Any] = asdict(seg)
-        # asdict will already expand nested dataclasses like TranscriptWord
-        data["segments"].append(seg_dict)
+    write_json(path, data)
+
 
-    with path.open("w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+def load_transcript_json(path: Path) -> TranscriptionResult:
+    """
+    Load a transcript written by `save_transcript_json`.
+
+    Provider raw responses are not persisted, so `raw_responses` is empty.
+    """
+    data = read_json(path.expanduser())
+
+    segments: List[TranscriptSegment] = []
+    for seg in data.get("segments", []):
+        words = [
+            TranscriptWord(
+                word=w["word"],
+                start=float(w["start"]),
+                end=float(w["end"]),
+                confidence=float(w["confidence"]),
+            )
+            for w in seg.get("words", [])
+        ]
+        segments.append(
+            TranscriptSegment(
+                id=int(seg["id"]),
+                start=float(seg["start"]),
+                end=float(seg["end"]),
+                text=seg["text"],
+                words=words,
+                avg_confidence=float(seg["avg_confidence"]),
+                chunk_index=int(seg["chunk_index"]),
+            )
+        )
+
+    return TranscriptionResult(
+        segments=segments,
+        language=data.get("language", ""),
+        raw_responses=[],
+    )
 
 
 def build_clean_transcript(
@@ -346,11 +630,23 @@ def build_clean_transcript(
 
     spans.sort()
 
-    def is_in_span(t: float) -> bool:
-        for s_start, s_end in spans:
-            if s_start <= t <= s_end:
-                return True
-        return False
+    # Merge overlapping spans so both `starts` and `ends` are increasing.
+    starts: List[float] = []
+    ends: List[float] = []
+    for s_start, s_end in spans:
+        if ends and s_start <= ends[-1]:
+            ends[-1] = max(ends[-1], s_end)
+        else:
+            starts.append(s_start)
+            ends.append(s_end)
+
+    # Word timestamps arrive (nearly) in time order, so walk a span pointer
+    # forward alongside them: `si` is the first span ending at or after the
+    # word's start, and the word is masked iff that span starts by the word's
+    # end (i.e. they overlap). O(words + spans) overall.
+    n_spans = len(ends)
+    si = 0
+    last_start = float("-inf")
 
     lines: List[str] = []
 
@@ -360,11 +656,17 @@ def build_clean_transcript(
             continue
 
         tokens: List[str] = []
+        append = tokens.append
         for w in seg.words:
-            if is_in_span(w.start) or is_in_span(w.end):
-                tokens.append(mask_token)
-            else:
-                tokens.append(w.word)
+            w_start = w.start
+            if w_start < last_start:
+                # Time went backwards (overlapping chunk edges): re-seek.
+                si = bisect_left(ends, w_start)
+            last_start = w_start
+            while si < n_spans and ends[si] < w_start:
+                si += 1
+            masked = si < n_spans and starts[si] <= w.end
+            append(mask_token if masked else w.word)
 
         lines.append(" ".join(tokens))
 
@@ -1,10 +1,14 @@
 from __future__ import annotations
 
+import io
 import logging
+import queue
 import threading
 import time
+import wave
+from concurrent.futures import Future
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, Tuple, Union
 
 
 logger = logging.getLogger(__name__)
@@ -14,26 +18,54 @@ logger = logging.getLogger(__name__)
 _local_whisper_models: Dict[str, Any] = {}
 
 # NOTE:
-# Chunk transcription runs in a ThreadPoolExecutor (see `transcribe_audio_chunks`).
-# The upstream `whisper` model object is not guaranteed to be thread-safe for
-# concurrent `model.transcribe(...)` calls. In practice, concurrent inference
+# With more than one worker, chunk transcription runs in a ProcessPoolExecutor
+# (see `transcriber._chunk_executor`), so each process loads its own model and
+# these caches/queues are per process. Callers may still share one model across
+# threads, though, and the upstream `whisper` model object is not guaranteed to
+# be thread-safe for concurrent `model.transcribe(...)` calls. In practice, concurrent inference
 # can trigger sporadic PyTorch shape mismatch / NoneType failures.
 #
-# We prevent that by serializing *per model name* calls to `transcribe`.
+# We prevent that by running every `transcribe` for a given model name on one
+# dedicated consumer thread: callers enqueue a job and wait on its Future, so
+# calls are serialized without parking every caller on a contended lock.
 _local_whisper_models_lock = threading.Lock()
-_local_whisper_transcribe_locks: Dict[str, threading.Lock] = {}
+_local_whisper_queues: Dict[str, "queue.SimpleQueue[_TranscribeJob]"] = {}
 
+# (model, audio input, transcribe kwargs, result future)
+_TranscribeJob = Tuple[Any, Any, Dict[str, Any], "Future[Any]"]
 
-def _get_transcribe_lock(model_name: str) -> threading.Lock:
-    """Return a per-model lock used to serialize model.transcribe calls."""
+
+def _transcribe_worker(jobs: "queue.SimpleQueue[_TranscribeJob]") -> None:
+    """Run queued model.transcribe jobs one at a time, forever (daemon thread)."""
+
+    while True:
+        mdl, audio_input, kwargs, fut = jobs.get()
+        if not fut.set_running_or_notify_cancel():
+            continue
+        try:
+            result = mdl.transcribe(audio_input, **kwargs)
+        except BaseException as exc:  # delivered to the waiting caller
+            fut.set_exception(exc)
+        else:
+            fut.set_result(result)
+
+
+def _get_transcribe_queue(model_name: str) -> "queue.SimpleQueue[_TranscribeJob]":
+    """Return the job queue for `model_name`, starting its consumer thread on first use."""
 
     model_name = (model_name or "base").strip()
     with _local_whisper_models_lock:
-        lock = _local_whisper_transcribe_locks.get(model_name)
-        if lock is None:
-            lock = threading.Lock()
-            _local_whisper_transcribe_locks[model_name] = lock
-        return lock
+        jobs = _local_whisper_queues.get(model_name)
+        if jobs is None:
+            jobs = queue.SimpleQueue()
+            threading.Thread(
+                target=_transcribe_worker,
+                args=(jobs,),
+                name=f"local-whisper-{model_name}",
+                daemon=True,
+            ).start()
+            _local_whisper_queues[model_name] = jobs
+        return jobs
 
 
 def _get_local_whisper_model(model_name: str) -> Any:
@@ -56,91 +88,52 @@ def _get_local_whisper_model(model_name: str) -> Any:
         return mdl
 
 
-def _normalize_local_whisper_result_to_verbose_json(raw: Dict[str, Any]) -> Dict[str, Any]:
-    """Convert `whisper` result dict into an OpenAI-like `verbose_json` shape.
+def _decode_wav_bytes(audio: bytes) -> Any:
+    """Decode in-memory 16-bit mono WAV bytes into the float32 array `whisper` accepts."""
 
-    This lets the rest of the pipeline reuse the same parsing logic.
-    """
-
-    language = str(raw.get("language") or "unknown")
-    segments_in = raw.get("segments") or []
-
-    segments_out: List[Dict[str, Any]] = []
-    for i, seg in enumerate(segments_in):
-        seg_start = float(seg.get("start", 0.0) or 0.0)
-        seg_end = float(seg.get("end", seg_start) or seg_start)
-        seg_text = str(seg.get("text", "")).strip()
-
-        words_in = seg.get("words") or []
-        words_out: List[Dict[str, Any]] = []
-        confidences: List[float] = []
-        for w in words_in:
-            w_text = str(w.get("word", "")).strip()
-            if not w_text:
-                continue
-
-            w_start = float(w.get("start", seg_start) or seg_start)
-            w_end = float(w.get("end", w_start) or w_start)
-
-            # `whisper` uses `probability` for word-level confidence.
-            prob = w.get("probability")
-            try:
-                w_conf = float(prob) if prob is not None else 1.0
-            except Exception:
-                w_conf = 1.0
-
-            confidences.append(w_conf)
-            words_out.append(
-                {
-                    "word": w_text,
-                    "start": w_start,
-                    "end": w_end,
-                    "confidence": w_conf,
-                }
-            )
-
-        if confidences:
-            seg_conf = sum(confidences) / len(confidences)
-        else:
-            # Fall back to a conservative default when word-level confidences are missing.
-            seg_conf = 1.0
+    import numpy as np  # type: ignore  # installed alongside `whisper`
 
-        segments_out.append(
-            {
-                "id": int(seg.get("id", i)),
-                "start": seg_start,
-                "end": seg_end,
-                "text": seg_text,
-                "confidence": seg_conf,
-                "words": words_out,
-            }
-        )
+    with wave.open(io.BytesIO(audio), "rb") as wf:
+        if wf.getnchannels() != 1 or wf.getsampwidth() != 2:
+            raise ValueError("In-memory audio must be 16-bit mono PCM WAV.")
+        pcm = wf.readframes(wf.getnframes())
 
-    return {
-        "language": language,
-        "segments": segments_out,
-    }
+    return np.frombuffer(pcm, dtype=np.int16).astype(np.float32) / 32768.0
 
 
 def transcribe_audio(
-    audio_path: Path,
+    audio: Union[Path, bytes],
     *,
     language: str,
     model: str,
     task: str = "transcribe",
     fp16: bool = False,
 ) -> Dict[str, Any]:
-    """Transcribe via local Whisper and return a `verbose_json`-like dict."""
+    """Transcribe via local Whisper and return its result dict.
+
+    `audio` is either a path to a 16 kHz WAV file or in-memory 16 kHz WAV bytes.
+
+    The result already has the `verbose_json` layout (language, segments with
+    words); words carry `probability` instead of `confidence`, which
+    `transcriber._parse_transcript_response` accepts directly.
+    """
+
+    if isinstance(audio, (bytes, bytearray)):
+        audio_desc = f"<in-memory wav, {len(audio)} bytes>"
+        audio_input: Any = _decode_wav_bytes(bytes(audio))
+    else:
+        audio_desc = str(audio)
+        audio_input = str(audio)
 
     mdl = _get_local_whisper_model(model)
-    lock = _get_transcribe_lock(model)
+    jobs = _get_transcribe_queue(model)
 
     # Helpful diagnostics when running with --verbose / debug logging.
     # (The reported runtime failures are consistent with concurrent calls.)
     t0 = time.monotonic()
     logger.debug(
-        "local_whisper: preparing to transcribe audio=%s model=%s model_id=%s thread=%s",
-        str(audio_path),
+        "local_whisper: queueing audio=%s model=%s model_id=%s thread=%s",
+        audio_desc,
         model,
         id(mdl),
         threading.current_thread().name,
@@ -150,26 +143,31 @@ def transcribe_audio(
     #   import whisper
     #   model = whisper.load_model(...)
     #   result = model.transcribe(...)
-    with lock:
-        waited_s = time.monotonic() - t0
-        if waited_s > 0.01:
-            logger.debug(
-                "local_whisper: waited %.3fs for per-model transcribe lock model=%s thread=%s",
-                waited_s,
-                model,
-                threading.current_thread().name,
-            )
-
-        result = mdl.transcribe(
-            str(audio_path),
-            task=task,
-            language=language,
-            word_timestamps=True,
-            verbose=False,
-            fp16=fp16,
+    # run on the model's consumer thread.
+    fut: "Future[Any]" = Future()
+    jobs.put(
+        (
+            mdl,
+            audio_input,
+            {
+                "task": task,
+                "language": language,
+                "word_timestamps": True,
+                "verbose": False,
+                "fp16": fp16,
+            },
+            fut,
         )
+    )
+    result = fut.result()
+    logger.debug(
+        "local_whisper: transcribed audio=%s model=%s in %.3fs (including queue wait)",
+        audio_desc,
+        model,
+        time.monotonic() - t0,
+    )
 
     if not isinstance(result, dict):
         raise RuntimeError("Unexpected transcription response type from local Whisper.")
 
-    return _normalize_local_whisper_result_to_verbose_json(result)
+    return result
@@ -1,15 +1,43 @@
 from __future__ import annotations
 
+import contextlib
+import importlib.util
 import json
+import threading
 from pathlib import Path
-from typing import Dict, List, Literal, Optional
+from typing import Any, Dict, Iterator, List, Literal, Optional, Tuple, Union
 
 from dotenv import load_dotenv
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
 
 
 # Lazily created global OpenAI client.
 _client: Optional[OpenAI] = None
+# Chunks are transcribed from worker threads; only one may build the client.
+_client_lock = threading.Lock()
+
+# Connection pool size for the shared sync client (one connection per
+# concurrent chunk upload, well above any sensible CHUNK_WORKERS).
+_MAX_CONNECTIONS = 64
+
+
+def _http_client_options(max_connections: int) -> Dict[str, Any]:
+    """httpx options shared by the sync and async OpenAI clients.
+
+    HTTP/2 lets concurrent uploads share one TLS connection, but httpx needs
+    the optional `h2` package for it, so it is only enabled when installed.
+    """
+
+    import httpx  # installed with `openai`
+
+    return {
+        "http2": importlib.util.find_spec("h2") is not None,
+        "limits": httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections,
+        ),
+        "timeout": httpx.Timeout(600.0, connect=10.0),
+    }
 
 
 def get_client() -> OpenAI:
@@ -21,42 +49,110 @@ def get_client() -> OpenAI:
 
     global _client
     if _client is None:
-        load_dotenv()
-        _client = OpenAI()
+        with _client_lock:
+            if _client is None:
+                from openai import DefaultHttpxClient
+
+                load_dotenv()
+                _client = OpenAI(
+                    http_client=DefaultHttpxClient(**_http_client_options(_MAX_CONNECTIONS))
+                )
     return _client
 
 
+def new_async_client(max_connections: Optional[int] = None) -> AsyncOpenAI:
+    """Return a fresh AsyncOpenAI client (same .env handling as `get_client`).
+
+    Async clients hold connections bound to the event loop that used them, so
+    callers create one per `asyncio.run` and share it across that run's
+    requests. `max_connections` sizes the keep-alive pool to the request
+    concurrency so connections (and their TLS sessions) are reused.
+    """
+
+    from openai import DefaultAsyncHttpxClient
+
+    load_dotenv()
+    options = _http_client_options(max_connections or _MAX_CONNECTIONS)
+    return AsyncOpenAI(http_client=DefaultAsyncHttpxClient(**options))
+
+
+@contextlib.contextmanager
+def _open_audio(audio: Union[Path, bytes]) -> Iterator[Tuple[str, Any, str]]:
+    """Yield the `(filename, content, mime)` tuple for a transcription request.
+
+    Files are passed as an open handle so the multipart body is streamed from
+    disk instead of being read into memory first.
+    """
+
+    if isinstance(audio, (bytes, bytearray)):
+        yield ("chunk.wav", bytes(audio), "audio/wav")
+        return
+
+    with audio.open("rb") as f:
+        yield (audio.name, f, "audio/wav")
+
+
+def _response_to_dict(response: Any) -> Dict:
+    # New OpenAI client returns pydantic-style objects; normalise to dict.
+    if hasattr(response, "model_dump"):
+        return response.model_dump()  # type: ignore[no-any-return]
+
+    if isinstance(response, dict):
+        return response
+
+    # Fallback to generic JSON serialization
+    try:
+        return json.loads(response.json())
+    except Exception as exc:  # noqa: BLE001
+        raise RuntimeError("Unexpected transcription response type from OpenAI.") from exc
+
+
 def transcribe_audio(
-    audio_path: Path,
+    audio: Union[Path, bytes],
     *,
     language: str,
     model: str,
 ) -> Dict:
-    """Transcribe via OpenAI API and return a `verbose_json`-like dict."""
+    """Transcribe via OpenAI API and return a `verbose_json`-like dict.
+
+    `audio` is either a path to a WAV file or in-memory WAV bytes.
+    """
 
     cli = get_client()
     ts_arg: List[Literal["segment", "word"]] = ["segment", "word"]
 
-    with audio_path.open("rb") as f:
+    with _open_audio(audio) as upload:
         response = cli.audio.transcriptions.create(
             model=model,
-            file=f,
+            file=upload,
             response_format="verbose_json",
             temperature=0.0,
             language=language,
             timestamp_granularities=ts_arg,
         )
 
-    # New OpenAI client returns pydantic-style objects; normalise to dict.
-    if hasattr(response, "model_dump"):
-        return response.model_dump()  # type: ignore[no-any-return]
+    return _response_to_dict(response)
 
-    if isinstance(response, dict):
-        return response
 
-    # Fallback to generic JSON serialization
-    try:
-        return json.loads(response.json())
-    except Exception as exc:  # noqa: BLE001
-        raise RuntimeError("Unexpected transcription response type from OpenAI.") from exc
+async def transcribe_audio_async(
+    audio: Union[Path, bytes],
+    *,
+    language: str,
+    model: str,
+    client: AsyncOpenAI,
+) -> Dict:
+    """Async variant of `transcribe_audio` using a caller-owned AsyncOpenAI client."""
+
+    ts_arg: List[Literal["segment", "word"]] = ["segment", "word"]
+
+    with _open_audio(audio) as upload:
+        response = await client.audio.transcriptions.create(
+            model=model,
+            file=upload,
+            response_format="verbose_json",
+            temperature=0.0,
+            language=language,
+            timestamp_granularities=ts_arg,
+        )
 
+    return _response_to_dict(response)
@@ -1,12 +1,22 @@
 from __future__ import annotations
 
-import json
+import contextlib
+import functools
 import logging
+import math
+import os
+import shutil
 import subprocess
+import sys
+import tempfile
+import wave
+from array import array
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Sequence, Tuple
+from types import MappingProxyType
+from typing import Any, FrozenSet, List, Optional, Sequence, Tuple
 
+from .aac_splice import splice_silence_into_aac
 from .config import AppConfig
 from .profanity_detector import ProfanitySpan
 
@@ -21,214 +31,437 @@ CLEAN_TRACK_TITLE = "Clean"
 MUTE_END_PADDING_SEC = 0.150
 
 
-@dataclass
-class FilterSpec:
-    """Represents an ffmpeg filter description."""
+def _merge_intervals(intervals: List[Tuple[float, float]]) -> List[Tuple[float, float]]:
+    """Sort `(start, end)` intervals and coalesce overlapping/touching ones."""
+    if not intervals:
+        return []
 
-    af: Optional[str] = None
-    filter_complex: Optional[str] = None
-    audio_output_label: str = "aout"
+    intervals = sorted(intervals)
+    # Track the open interval in locals; emit a tuple only when it closes.
+    merged: List[Tuple[float, float]] = []
+    cur_start, cur_end = intervals[0]
+    for start, end in intervals:
+        if start <= cur_end:
+            if end > cur_end:
+                cur_end = end
+        else:
+            merged.append((cur_start, cur_end))
+            cur_start, cur_end = start, end
+    merged.append((cur_start, cur_end))
+    return merged
+
+
+_SpanKey = Tuple[Tuple[float, float], ...]
+
+
+def _span_key(spans: Sequence[ProfanitySpan]) -> _SpanKey:
+    """Hashable `(start, end)` pairs of `spans`, used to memoize the filter builders."""
+    return tuple([(float(span.start), float(span.end)) for span in spans])
+
+
+def _span_intervals(spans: Sequence[ProfanitySpan], end_padding: float = 0.0) -> List[Tuple[float, float]]:
+    """
+    Clamped, padded span intervals, merged into a minimal disjoint cover.
+
+    Empty when no span reaches t >= 0; the filter builders then return None
+    and the mux falls back to a plain stream copy.
+    """
+    return _pair_intervals(_span_key(spans), end_padding)
+
+
+def _pair_intervals(pairs: _SpanKey, end_padding: float = 0.0) -> List[Tuple[float, float]]:
+    """`_span_intervals` for already-extracted `(start, end)` pairs."""
+    clamped = [(max(0.0, start), end) for start, end in pairs]
+    # Spans ending before t=0 are dropped: nothing to censor there.
+    return _merge_intervals(
+        [(start, max(start, end) + end_padding) for start, end in clamped if end >= 0.0]
+    )
+
+
+_MUTE_INTERVAL_TPL = "volume=enable='between(t,%.3f,%.3f)':volume=0"
 
 
 def build_mute_filter(spans: Sequence[ProfanitySpan]) -> Optional[str]:
     """
     Build a simple -af volume filter string that mutes all profanity spans.
 
+    Overlapping or touching spans (common after end padding) are merged first,
+    so ffmpeg evaluates one `between()` per disjoint interval.
+
     Example:
         volume=enable='between(t,START,END)':volume=0,volume=...
+
+    Results are memoized on the spans' `(start, end)` pairs, so re-running
+    the same censor set (e.g. while tuning output settings) skips the work.
     """
     if not spans:
         return None
+    return _mute_filter(_span_key(spans))
+
+
+@functools.lru_cache(maxsize=32)
+def _mute_filter(pairs: _SpanKey) -> Optional[str]:
+    intervals = _pair_intervals(pairs, MUTE_END_PADDING_SEC)
+    if not intervals:
+        return None
+
+    # Intervals are (start, end) tuples, so each one fills the template as-is.
+    return ",".join([_MUTE_INTERVAL_TPL % interval for interval in intervals])
 
-    parts: List[str] = []
-    for span in spans:
-        start = max(0.0, float(span.start))
-        end = max(start, float(span.end)) + MUTE_END_PADDING_SEC
-        parts.append(
-            f"volume=enable='between(t,{start:.3f},{end:.3f})':volume=0"
-        )
 
-    return ",".join(parts)
+# Pre-rendered beep: one second of a 1 kHz sine at half scale. 1 kHz divides
+# the sample rate, so the file loops seamlessly with `-stream_loop -1`.
+BEEP_FREQUENCY_HZ = 1000
+BEEP_SAMPLE_RATE = 16000
 
 
-def build_bleep_filter(spans: Sequence[ProfanitySpan], sample_rate: int = 16000) -> Optional[str]:
+@functools.lru_cache(maxsize=1)
+def _beep_tone_pcm() -> bytes:
+    """Little-endian 16-bit samples of the beep tone, computed once per process."""
+    step = 2 * math.pi * BEEP_FREQUENCY_HZ / BEEP_SAMPLE_RATE
+    samples = array("h", (int(16383 * math.sin(step * i)) for i in range(BEEP_SAMPLE_RATE)))
+    if sys.byteorder != "little":
+        samples.byteswap()
+    return samples.tobytes()
+
+
+def beep_tone_wav(work_dir: Path) -> Optional[Path]:
+    """
+    Render a 16-bit mono WAV of the beep tone into `work_dir` and return it.
+
+    `work_dir` is a directory the caller owns for this run (the mux temp dir),
+    so a stale or foreign file is never picked up as the bleep audio. Returns
+    None if it cannot be written; callers then fall back to aevalsrc.
+    """
+    path = work_dir / "beep.wav"
+    try:
+        with wave.open(str(path), "wb") as wf:
+            wf.setnchannels(1)
+            wf.setsampwidth(2)
+            wf.setframerate(BEEP_SAMPLE_RATE)
+            wf.writeframes(_beep_tone_pcm())
+    except OSError as exc:
+        logger.warning("Could not write beep tone %s: %s", path, exc)
+        return None
+    return path
+
+
+def build_bleep_filter(
+    spans: Sequence[ProfanitySpan],
+    sample_rate: int = 16000,
+    tone_input: Optional[int] = None,
+) -> Optional[str]:
     """
     Build a -filter_complex graph that overlays synthetic beep tones on profanity spans.
 
-    This implementation uses a 1kHz sine tone generated via aevalsrc and
-    delayed/mixed over the original audio:
+    Overlapping spans are merged first so no stretch gets two beeps.
+
+    With `tone_input`, the tone comes from that ffmpeg input (the looped
+    `beep_tone_wav()`), gated to the spans and mixed once:
+
+        [0:a:0]anull[a0];
+        [1:a]volume=0:enable='not(between(t,...)+...)'[b0];
+        [a0][b0]amix=inputs=2:normalize=0:duration=first[aout]
+
+    Without it, one 1kHz sine generated via aevalsrc is split per span,
+    trimmed, delayed and mixed over the original audio:
 
         [0:a:0]anull[a0];
-        aevalsrc=... [t0];[t0]adelay=... [b0];
-        [a0][b0]amix=inputs=2[aout]
+        aevalsrc=...,asplit=N[tone0]...;[tone0]atrim=end=...,adelay=...:all=1[b0];...
+        [a0][b0]amix=inputs=2:normalize=0:dropout_transition=0:duration=first[aout]
 
-    For multiple spans, multiple tone streams are created and mixed together.
+    Memoized like `build_mute_filter`.
     """
     if not spans:
         return None
+    return _bleep_filter(_span_key(spans), sample_rate, tone_input)
+
+
+@functools.lru_cache(maxsize=32)
+def _bleep_filter(
+    pairs: _SpanKey,
+    sample_rate: int,
+    tone_input: Optional[int],
+) -> Optional[str]:
+    intervals = _pair_intervals(pairs)
+    if not intervals:
+        return None
 
     chains: List[str] = []
 
     # Base audio
     chains.append("[0:a:0]anull[a0]")
 
-    beep_labels: List[str] = []
-
-    for idx, span in enumerate(spans):
-        start = max(0.0, float(span.start))
-        end = max(start, float(span.end))
-        duration = max(0.1, end - start)
-        delay_ms = int(round(start * 1000))
-
-        tone_label = f"tone{idx}"
-        beep_label = f"b{idx}"
-
-        # Generate tone of given duration
-        chains.append(
-            f"aevalsrc=0.5*sin(2*PI*1000*t):s={sample_rate}:d={duration:.3f}[{tone_label}]"
+    if tone_input is not None:
+        windows = "+".join(
+            f"between(t,{start:.3f},{max(end, start + 0.1):.3f})"
+            for start, end in intervals
         )
-        # Delay tone to align with profanity span
+        # Silence the looped tone everywhere except the spans; the graph ends
+        # with the original audio (the tone input is infinite).
+        chains.append(f"[{tone_input}:a]volume=0:enable='not({windows})'[b0]")
+        chains.append("[a0][b0]amix=inputs=2:normalize=0:duration=first[aout]")
+        return ";".join(chains)
+
+    n_spans = len(intervals)
+    durations = [max(0.1, end - start) for start, end in intervals]
+    beep_labels = [f"[b{idx}]" for idx in range(n_spans)]
+
+    # One sine source as long as the longest beep, fanned out with asplit and
+    # cut to each span's length, instead of one generator per span. The tone
+    # is mono, so one delay applied to all channels is enough.
+    source = "aevalsrc=0.5*sin(2*PI*1000*t):s=%d:d=%.3f" % (sample_rate, max(durations))
+    if n_spans == 1:
+        chains.append(f"{source}[tone0]")
+        chains.append("[tone0]adelay=%d:all=1[b0]" % int(round(intervals[0][0] * 1000)))
+    else:
+        chains.append(source + ",asplit=%d" % n_spans + "".join(f"[tone{idx}]" for idx in range(n_spans)))
+        span_tpl = "[tone%d]atrim=end=%.3f,adelay=%d:all=1[b%d]"
+        chains.extend(
+            span_tpl % (idx, duration, int(round(start * 1000)), idx)
+            for idx, ((start, _), duration) in enumerate(zip(intervals, durations))
+        )
+
+    # Mix original with all beep tracks. The output lasts as long as the
+    # original (first) input, and beeps ending mid-stream do not trigger
+    # amix's dropout volume ramp.
+    labels = ["[a0]"] + beep_labels
+    if len(labels) <= _AMIX_TREE_MIN_INPUTS:
         chains.append(
-            f"[{tone_label}]adelay={delay_ms}|{delay_ms}[{beep_label}]"
+            f"{''.join(labels)}amix=inputs={len(labels)}:{_AMIX_OPTIONS}:duration=first[aout]"
         )
+    else:
+        chains.extend(_amix_tree(labels, "[aout]"))
 
-        beep_labels.append(f"[{beep_label}]")
+    return ";".join(chains)
 
-    # Mix original with all beep tracks
-    inputs = "[a0]" + "".join(beep_labels)
-    n_inputs = 1 + len(beep_labels)
-    chains.append(f"{inputs}amix=inputs={n_inputs}:normalize=0[aout]")
 
-    return ";".join(chains)
+# Below this many inputs a single amix node is cheaper than a tree of them.
+_AMIX_TREE_MIN_INPUTS = 5
 
+# Shared amix settings for the beep overlay: no input scaling, no dropout ramp.
+_AMIX_OPTIONS = "normalize=0:dropout_transition=0"
 
-def probe_primary_audio_codec_and_bitrate(input_video: Path) -> Tuple[Optional[str], Optional[int]]:
-    """Return (codec_name, bit_rate) for the primary input audio stream (0:a:0).
 
-    - codec_name is a lowercase ffprobe codec name (e.g. aac, ac3, eac3)
-    - bit_rate is in bits/second when available.
+def _amix_tree(labels: List[str], out_label: str) -> List[str]:
+    """
+    Sum `labels` with a balanced tree of 2-input amix nodes ending in `out_label`.
 
-    This helper is best-effort: it returns (None, None) on ffprobe failures.
+    With normalize=0 the result equals one wide amix, but no node's fan-in
+    grows with the number of spans. `labels[0]` must be the original audio:
+    the nodes on its path use duration=first so the mix keeps its length.
+    """
+    chains: List[str] = []
+    level = list(labels)
+    node = 0
+    while len(level) > 1:
+        next_level: List[str] = []
+        for i in range(0, len(level) - 1, 2):
+            label = out_label if len(level) == 2 else f"[m{node}]"
+            # level[0] always carries the original audio: it sets the length.
+            duration = ":duration=first" if i == 0 else ""
+            chains.append(f"{level[i]}{level[i + 1]}amix=inputs=2:{_AMIX_OPTIONS}{duration}{label}")
+            next_level.append(label)
+            node += 1
+        if len(level) % 2:
+            next_level.append(level[-1])
+        level = next_level
+    return chains
+
+
+@dataclass(frozen=True)
+class AudioProbe:
+    """Audio metadata from one ffprobe call.
+
+    Fields describe the primary audio stream (0:a:0) except `stream_count`
+    and `titles`, which cover all audio streams. Unknown values are None
+    (0 streams when probing failed).
     """
 
-    input_video = input_video.expanduser().resolve()
-    cmd = [
-        "ffprobe",
-        "-v",
-        "error",
-        "-select_streams",
-        "a:0",
-        "-show_entries",
-        "stream=codec_name,bit_rate",
-        "-of",
-        "json",
-        str(input_video),
-    ]
+    codec_name: Optional[str] = None
+    bit_rate: Optional[int] = None
+    sample_rate: Optional[int] = None
+    channels: Optional[int] = None
+    channel_layout: Optional[str] = None
+    duration_sec: Optional[float] = None
+    stream_count: int = 0
+    # `title` tag of every audio stream, in order ("" when untagged).
+    titles: Tuple[str, ...] = ()
 
-    result = subprocess.run(
-        cmd,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        text=True,
-    )
 
-    if result.returncode != 0:
-        logger.warning("ffprobe failed (code=%s): %s", result.returncode, result.stderr)
-        return None, None
+def _int_or_none(raw: Any) -> Optional[int]:
+    if raw is None:
+        return None
+    try:
+        return int(str(raw).strip())
+    except ValueError:
+        return None
+
 
+def _float_or_none(raw: Any) -> Optional[float]:
+    if raw is None:
+        return None
     try:
-        data = json.loads(result.stdout or "{}")
-    except json.JSONDecodeError:
-        logger.warning("ffprobe returned non-JSON output")
-        return None, None
-
-    streams = data.get("streams") or []
-    if not streams:
-        return None, None
-
-    stream0 = streams[0] or {}
-    codec_name_raw = stream0.get("codec_name")
-    codec_name = str(codec_name_raw).strip().lower() if codec_name_raw else None
-
-    bit_rate_raw = stream0.get("bit_rate")
-    bit_rate: Optional[int]
-    if bit_rate_raw is None:
-        bit_rate = None
-    else:
-        try:
-            bit_rate = int(str(bit_rate_raw).strip())
-        except ValueError:
-            bit_rate = None
+        return float(str(raw).strip())
+    except ValueError:
+        return None
 
-    return codec_name, bit_rate
 
+@functools.lru_cache(maxsize=256)
+def _canon_str(path: str) -> Path:
+    return Path(path).expanduser()
 
-def probe_primary_audio_codec_bitrate_and_count(
-    input_video: Path,
-) -> Tuple[Optional[str], Optional[int], int]:
-    """Return (codec_name, bit_rate, audio_stream_count) for input.
 
-    - codec_name/bit_rate describe the primary audio stream (0:a:0).
-    - audio_stream_count counts all audio streams in the input.
+def _canon(path: Path) -> Path:
+    """
+    `path` with `~` expanded, memoized per path string.
 
-    Best-effort: returns (None, None, 0) on ffprobe failures.
+    Every public helper here normalizes its paths on entry; this keeps the
+    pipeline's repeated calls for the same video on one shared Path object.
+    """
+    return _canon_str(str(path))
+
+
+def _probe_cache_key(path: Path) -> Optional[Tuple[str, int, int]]:
+    """(absolute path, size, mtime_ns) identifying this version of `path`, or None if unstattable."""
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return os.path.abspath(path), st.st_size, st.st_mtime_ns
+
+
+def clear_probe_cache() -> None:
+    """Forget cached ffprobe results (e.g. between tests)."""
+    _probe_audio.cache_clear()
+
+
+def probe_audio(input_video: Path) -> AudioProbe:
+    """Return codec, bitrate, format and stream-count metadata for the input's audio.
+
+    One ffprobe call serves every audio metadata need. Best-effort: returns an
+    empty AudioProbe on ffprobe failures.
+
+    Results are cached per (path, size, mtime), so probing an unchanged file
+    again does not spawn another ffprobe. Paths that cannot be stat'ed bypass
+    the cache.
     """
 
-    input_video = input_video.expanduser().resolve()
-    cmd = [
+    input_video = _canon(input_video)
+    key = _probe_cache_key(input_video)
+    if key is None:
+        return _probe_audio.__wrapped__(str(input_video), 0, 0)
+    return _probe_audio(*key)
+
+
+def _probe_audio_cmd(input_video: str) -> List[str]:
+    return [
         "ffprobe",
         "-v",
         "error",
         "-select_streams",
         "a",
         "-show_entries",
-        "stream=codec_name,bit_rate",
+        "stream=codec_name,bit_rate,sample_rate,channels,channel_layout,duration:stream_tags=title",
+        # One `key=value,...` line per audio stream. Keys are kept because
+        # ffprobe prints fields in its own order, not the -show_entries order;
+        # the title tag always comes last, as `tag:title=...`.
         "-of",
-        "json",
-        str(input_video),
+        "csv=p=0:nk=0",
+        input_video,
     ]
 
+
+def _decode_stderr(stderr: Optional[bytes]) -> str:
+    """Decode captured ffmpeg/ffprobe stderr; only done on the failure path."""
+    return (stderr or b"").decode("utf-8", "replace")
+
+
+def _parse_probe_output(returncode: int, stdout: bytes, stderr: bytes) -> AudioProbe:
+    if returncode != 0:
+        logger.warning("ffprobe failed (code=%s): %s", returncode, _decode_stderr(stderr))
+        return AudioProbe()
+
+    lines = [line for line in (stdout or b"").decode("utf-8", "replace").splitlines() if line.strip()]
+    if not lines:
+        return AudioProbe()
+
+    fields: List[str] = []
+    titles: List[str] = []
+    for line in lines:
+        # Split the (free-text) title off first: it may contain commas.
+        head, _, title = line.partition(_TITLE_TAG_KEY)
+        fields.append(head)
+        titles.append(_unquote_csv(title.strip()))
+
+    stream0 = dict(item.split("=", 1) for item in fields[0].split(",") if "=" in item)
+    codec_name_raw = stream0.get("codec_name", "").strip()
+    layout_raw = stream0.get("channel_layout", "").strip()
+
+    return AudioProbe(
+        codec_name=codec_name_raw.lower() if codec_name_raw else None,
+        bit_rate=_int_or_none(stream0.get("bit_rate")),
+        sample_rate=_int_or_none(stream0.get("sample_rate")),
+        channels=_int_or_none(stream0.get("channels")),
+        channel_layout=layout_raw if layout_raw else None,
+        duration_sec=_float_or_none(stream0.get("duration")),
+        stream_count=len(lines),
+        titles=tuple(titles),
+    )
+
+
+_TITLE_TAG_KEY = "tag:title="
+
+
+def _unquote_csv(value: str) -> str:
+    """Undo ffprobe's CSV escaping of one value (quoted when it has , or ")."""
+    if len(value) >= 2 and value[0] == value[-1] == '"':
+        return value[1:-1].replace('""', '"')
+    return value
+
+
+@functools.lru_cache(maxsize=128)
+def _probe_audio(input_video: str, size: int, mtime_ns: int) -> AudioProbe:
+    # `size` and `mtime_ns` are only part of the cache key.
     try:
         result = subprocess.run(
-            cmd,
+            _probe_audio_cmd(input_video),
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
-            text=True,
         )
     except FileNotFoundError:
         logger.warning("ffprobe not found on PATH; cannot probe audio streams")
-        return None, None, 0
+        return AudioProbe()
 
-    if result.returncode != 0:
-        logger.warning("ffprobe failed (code=%s): %s", result.returncode, result.stderr)
-        return None, None, 0
+    return _parse_probe_output(result.returncode, result.stdout, result.stderr)
 
-    try:
-        data: Dict[str, Any] = json.loads(result.stdout or "{}")
-    except json.JSONDecodeError:
-        logger.warning("ffprobe returned non-JSON output")
-        return None, None, 0
-
-    streams = data.get("streams") or []
-    audio_stream_count = len(streams)
-    if not streams:
-        return None, None, 0
-
-    stream0 = streams[0] or {}
-    codec_name_raw = stream0.get("codec_name")
-    codec_name = str(codec_name_raw).strip().lower() if codec_name_raw else None
-
-    bit_rate_raw = stream0.get("bit_rate")
-    bit_rate: Optional[int]
-    if bit_rate_raw is None:
-        bit_rate = None
-    else:
-        try:
-            bit_rate = int(str(bit_rate_raw).strip())
-        except ValueError:
-            bit_rate = None
 
-    return codec_name, bit_rate, audio_stream_count
+def probe_primary_audio_codec_and_bitrate(input_video: Path) -> Tuple[Optional[str], Optional[int]]:
+    """Return (codec_name, bit_rate) for the primary input audio stream (0:a:0).
+
+    - codec_name is a lowercase ffprobe codec name (e.g. aac, ac3, eac3)
+    - bit_rate is in bits/second when available.
+
+    This helper is best-effort: it returns (None, None) on ffprobe failures.
+    """
+
+    probe = probe_audio(input_video)
+    return probe.codec_name, probe.bit_rate
+
+
+def probe_primary_audio_codec_bitrate_and_count(
+    input_video: Path,
+) -> Tuple[Optional[str], Optional[int], int]:
+    """Return (codec_name, bit_rate, audio_stream_count) for input.
+
+    - codec_name/bit_rate describe the primary audio stream (0:a:0).
+    - audio_stream_count counts all audio streams in the input.
+
+    Best-effort: returns (None, None, 0) on ffprobe failures.
+    """
+
+    probe = probe_audio(input_video)
+    return probe.codec_name, probe.bit_rate, probe.stream_count
 
 
 def input_has_clean_track_marker(input_video: Path, *, marker_title: str = CLEAN_TRACK_TITLE) -> bool:
@@ -238,72 +471,89 @@ def input_has_clean_track_marker(input_video: Path, *, marker_title: str = CLEAN
     - We tag the generated clean audio stream with `title=Clean`.
     - This helper checks audio stream tags for that title.
 
+    The titles come from the same cached `probe_audio` call the mux uses, so
+    checking the marker and muxing cost one ffprobe run per input.
+
     Best-effort: returns False on ffprobe failures.
     """
 
-    input_video = input_video.expanduser().resolve()
-    cmd = [
-        "ffprobe",
-        "-v",
-        "error",
-        "-select_streams",
-        "a",
-        "-show_entries",
-        "stream_tags=title",
-        "-of",
-        "json",
-        str(input_video),
-    ]
+    wanted = marker_title.strip().lower()
+    return any(title.strip().lower() == wanted for title in probe_audio(input_video).titles)
+
+
+# ffprobe codec name -> ffmpeg encoder for the clean track. Matching the
+# input codec keeps the container's audio uniform; anything else gets AAC.
+_ENCODERS_BY_CODEC = MappingProxyType(
+    {
+        "aac": "aac",
+        "ac3": "ac3",
+        "eac3": "eac3",
+        "opus": "libopus",
+        "vorbis": "libvorbis",
+        "mp3": "libmp3lame",
+    }
+)
+
+# Encoders built into every ffmpeg; the external libraries above are optional.
+_NATIVE_ENCODERS = frozenset({"aac", "ac3", "eac3"})
 
+
+@functools.lru_cache(maxsize=1)
+def _available_encoders() -> FrozenSet[str]:
+    """Audio encoder names compiled into the local ffmpeg (`ffmpeg -encoders`), probed once."""
     try:
         result = subprocess.run(
-            cmd,
+            ["ffmpeg", "-hide_banner", "-encoders"],
             stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
+            stderr=subprocess.DEVNULL,
         )
     except FileNotFoundError:
-        logger.warning("ffprobe not found on PATH; cannot check clean-track marker")
-        return False
-
+        return frozenset()
     if result.returncode != 0:
-        logger.warning("ffprobe failed while checking clean marker (code=%s): %s", result.returncode, result.stderr)
-        return False
-
-    try:
-        data: Dict[str, Any] = json.loads(result.stdout or "{}")
-    except json.JSONDecodeError:
-        logger.warning("ffprobe returned non-JSON output while checking clean marker")
-        return False
+        return frozenset()
 
-    streams = data.get("streams") or []
-    wanted = marker_title.strip().lower()
-    for stream in streams:
-        tags = (stream or {}).get("tags") or {}
-        title_raw = tags.get("title")
-        title = str(title_raw).strip().lower() if title_raw else ""
-        if title == wanted:
-            return True
-    return False
+    names = set()
+    for line in result.stdout.decode("utf-8", "replace").splitlines():
+        # " A....D libopus   libopus Opus": a six-letter flags column, then the name.
+        parts = line.split(None, 2)
+        if len(parts) >= 2 and len(parts[0]) == 6 and parts[0].startswith("A"):
+            names.add(parts[1])
+    return frozenset(names)
 
 
 def _encoder_for_codec_name(codec_name: Optional[str]) -> str:
     """Return an ffmpeg audio encoder name for a given ffprobe codec name."""
 
-    codec = (codec_name or "").strip().lower()
-    mapping = {
-        "aac": "aac",
-        "ac3": "ac3",
-        "eac3": "eac3",
-    }
+    if not codec_name:
+        return "aac"
+    # ffprobe already reports canonical lowercase names; only normalize others.
+    codec = codec_name
+    encoder = _ENCODERS_BY_CODEC.get(codec)
+    if encoder is None:
+        codec = codec_name.strip().lower()
+        encoder = _ENCODERS_BY_CODEC.get(codec)
+
+    if encoder is None:
+        if codec:
+            logger.warning("Unsupported input audio codec %r; falling back to AAC", codec)
+        return "aac"
 
-    encoder = mapping.get(codec)
-    if encoder:
-        return encoder
+    if encoder not in _NATIVE_ENCODERS and encoder not in _available_encoders():
+        logger.warning("ffmpeg has no %s encoder for %r audio; falling back to AAC", encoder, codec)
+        return "aac"
+    return encoder
 
-    if codec:
-        logger.warning("Unsupported input audio codec %r; falling back to AAC", codec)
-    return "aac"
+
+# Constant command fragments, shared by every mux command.
+_FFMPEG_HEAD = ("ffmpeg", "-y", "-i")
+_MKV_STREAM_MAPS = ("-map", "0")
+_DEFAULT_STREAM_MAPS = ("-map", "0:v:0", "-map", "0:a")
+_METADATA_MAPS = ("-map_metadata", "0", "-map_chapters", "0")
+
+
+def _stream_copy_cmd(input_video: Path, output_video: Path) -> List[str]:
+    """Plain `-c copy` remux, used when there is nothing to censor."""
+    return [*_FFMPEG_HEAD, str(input_video), "-c", "copy", str(output_video)]
 
 
 def _build_ffmpeg_censor_and_mux_cmd(
@@ -315,48 +565,39 @@ def _build_ffmpeg_censor_and_mux_cmd(
     primary_audio_codec: Optional[str],
     primary_audio_bit_rate: Optional[int],
     input_audio_stream_count: int,
+    clean_audio: Optional[Path] = None,
+    work_dir: Optional[Path] = None,
 ) -> List[str]:
-    """Build the ffmpeg command used by apply_audio_filters_and_mux()."""
+    """Build the ffmpeg command used by apply_audio_filters_and_mux().
+
+    `clean_audio` is an already-censored audio file (see
+    `aac_splice.splice_silence_into_aac`); it is muxed in as the clean track
+    with stream copy instead of filtering and re-encoding 0:a:0.
+
+    `work_dir` is the caller's per-run temp dir; bleep mode renders its tone
+    file there. Without it, the beeps are generated with aevalsrc instead.
+    """
 
-    input_video = input_video.expanduser().resolve()
-    output_video = output_video.expanduser().resolve()
+    input_video = _canon(input_video)
+    output_video = _canon(output_video)
 
     if not spans:
-        return [
-            "ffmpeg",
-            "-y",
-            "-i",
-            str(input_video),
-            "-c",
-            "copy",
-            str(output_video),
-        ]
-
-    if config.mode == "mute":
+        return _stream_copy_cmd(input_video, output_video)
+
+    tone_wav: Optional[Path] = None
+    filter_complex: Optional[str] = None
+    if clean_audio is not None:
+        pass
+    elif config.mode == "mute":
         af = build_mute_filter(spans)
         if not af:
-            return [
-                "ffmpeg",
-                "-y",
-                "-i",
-                str(input_video),
-                "-c",
-                "copy",
-                str(output_video),
-            ]
+            return _stream_copy_cmd(input_video, output_video)
         filter_complex = f"[0:a:0]{af}[aout]"
     else:
-        fc = build_bleep_filter(spans)
+        tone_wav = beep_tone_wav(work_dir) if work_dir is not None else None
+        fc = build_bleep_filter(spans, tone_input=1 if tone_wav is not None else None)
         if not fc:
-            return [
-                "ffmpeg",
-                "-y",
-                "-i",
-                str(input_video),
-                "-c",
-                "copy",
-                str(output_video),
-            ]
+            return _stream_copy_cmd(input_video, output_video)
         filter_complex = fc
 
     encoder = _encoder_for_codec_name(primary_audio_codec)
@@ -365,34 +606,31 @@ def _build_ffmpeg_censor_and_mux_cmd(
 
     preserve_all_streams = output_video.suffix.lower() == ".mkv"
 
-    cmd: List[str] = [
-        "ffmpeg",
-        "-y",
-        "-i",
-        str(input_video),
-        "-filter_complex",
-        filter_complex,
-    ]
+    cmd: List[str] = [*_FFMPEG_HEAD, str(input_video)]
+    if clean_audio is not None:
+        cmd.extend(["-i", str(clean_audio)])
+    if tone_wav is not None:
+        cmd.extend(["-stream_loop", "-1", "-i", str(tone_wav)])
+    if filter_complex is not None:
+        cmd.extend(["-filter_complex", filter_complex])
 
-    if preserve_all_streams:
-        # Preserve subtitles/attachments/chapters for MKV outputs.
-        cmd.extend(["-map", "0"])
-    else:
-        # Safer default for non-MKV outputs: preserve primary video + all audio.
-        # (Subtitles/attachments may not be compatible with MP4 and can cause mux failures.)
-        cmd.extend(["-map", "0:v:0", "-map", "0:a"])
+    # MKV keeps subtitles/attachments/chapters; other containers get primary
+    # video + all audio (subtitles/attachments may not fit MP4 and can fail the mux).
+    cmd.extend(_MKV_STREAM_MAPS if preserve_all_streams else _DEFAULT_STREAM_MAPS)
 
     # Append the clean/censored audio as an additional track.
-    cmd.extend(["-map", "[aout]"])
+    cmd.extend(("-map", "1:a:0" if clean_audio is not None else "[aout]"))
 
     # Preserve global metadata and chapters where supported.
-    cmd.extend(["-map_metadata", "0", "-map_chapters", "0"])
-
-    # Copy everything by default, but re-encode only the appended clean audio.
-    cmd.extend(["-c", "copy", f"-c:a:{clean_idx}", encoder])
+    cmd.extend(_METADATA_MAPS)
 
-    if primary_audio_bit_rate and primary_audio_bit_rate > 0:
-        cmd.extend([f"-b:a:{clean_idx}", str(primary_audio_bit_rate)])
+    # Copy everything by default, but re-encode only the appended clean audio
+    # (unless it was spliced, in which case it is copied too).
+    cmd.extend(["-c", "copy"])
+    if clean_audio is None:
+        cmd.extend([f"-c:a:{clean_idx}", encoder])
+        if primary_audio_bit_rate and primary_audio_bit_rate > 0:
+            cmd.extend([f"-b:a:{clean_idx}", str(primary_audio_bit_rate)])
 
     # Tag the clean track so reprocessing can skip the file by default.
     cmd.extend([f"-metadata:s:a:{clean_idx}", f"title={CLEAN_TRACK_TITLE}"])
@@ -405,6 +643,66 @@ def _build_ffmpeg_censor_and_mux_cmd(
     return cmd
 
 
+class _LazyJoin:
+    """Log argument that joins `parts` only if a handler actually formats it."""
+
+    __slots__ = ("parts",)
+
+    def __init__(self, parts: Sequence[str]) -> None:
+        self.parts = parts
+
+    def __str__(self) -> str:
+        return " ".join(self.parts)
+
+
+def _same_file(a: Path, b: Path) -> bool:
+    try:
+        return os.path.samefile(a, b)
+    except OSError:
+        return a.resolve() == b.resolve()
+
+
+def link_or_copy(src: Path, dst: Path, *, hardlink: bool = False) -> None:
+    """
+    Place an unchanged copy of `src` at `dst`.
+
+    Copies by default (`shutil.copyfile` uses the kernel's zero-copy path
+    where available). With `hardlink=True`, hard-links instead when both paths
+    are on the same filesystem; `dst` then shares the inode of `src`, so an
+    in-place edit of one changes the other.
+
+    The link/copy is made under a temporary name and moved over `dst` with
+    `os.replace`, so an existing `dst` is only replaced once it succeeded.
+    Does nothing when `dst` already is `src` (by any path).
+    """
+    if _same_file(src, dst):
+        return
+
+    tmp = dst.with_name(f"{dst.name}.{os.getpid()}.tmp")
+    tmp.unlink(missing_ok=True)
+    try:
+        linked = False
+        if hardlink:
+            try:
+                os.link(src, tmp)
+                linked = True
+            except OSError:
+                # Cross-device, or a filesystem without hard links.
+                pass
+        if not linked:
+            shutil.copyfile(src, tmp)
+        os.replace(tmp, dst)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            tmp.unlink()
+        raise
+
+
+def _can_link_unchanged(input_video: Path, output_video: Path) -> bool:
+    """True when an uncensored input can be linked/copied as-is (no container change)."""
+    return input_video.suffix.lower() == output_video.suffix.lower()
+
+
 def apply_audio_filters_and_mux(
     input_video: Path,
     output_video: Path,
@@ -416,36 +714,52 @@ def apply_audio_filters_and_mux(
 
     - When spans are present, filtering is applied only to 0:a:0 via -filter_complex.
     - Other audio streams are preserved via stream copy.
+    - Without spans the input is copied as-is (hard-linked with
+      `config.hardlink_output`), unless `config.force_remux` asks for an
+      ffmpeg `-c copy` remux.
     """
-    input_video = input_video.expanduser().resolve()
-    output_video = output_video.expanduser().resolve()
-
-    codec_name: Optional[str]
-    bit_rate: Optional[int]
-    audio_stream_count: int
-    if spans:
-        codec_name, bit_rate, audio_stream_count = probe_primary_audio_codec_bitrate_and_count(input_video)
-    else:
-        codec_name, bit_rate, audio_stream_count = None, None, 0
-    cmd = _build_ffmpeg_censor_and_mux_cmd(
-        input_video=input_video,
-        output_video=output_video,
-        spans=spans,
-        config=config,
-        primary_audio_codec=codec_name,
-        primary_audio_bit_rate=bit_rate,
-        input_audio_stream_count=audio_stream_count,
-    )
+    input_video = _canon(input_video)
+    output_video = _canon(output_video)
+
+    if not spans and not config.force_remux and _can_link_unchanged(input_video, output_video):
+        link_or_copy(input_video, output_video, hardlink=config.hardlink_output)
+        logger.info("No spans to censor; linked/copied %s to %s", input_video, output_video)
+        return
+
+    probe = probe_audio(input_video) if spans else AudioProbe()
+
+    with tempfile.TemporaryDirectory(prefix="dialogsafe_mux_") as tmpdir:
+        clean_audio: Optional[Path] = None
+        mute_intervals = _span_intervals(spans, MUTE_END_PADDING_SEC) if spans else []
+        if config.aac_splice and config.mode == "mute" and probe.codec_name == "aac" and mute_intervals:
+            # Splice silent frames into the AAC track instead of re-encoding it
+            # (opt-in; needs PyAV; returns False to fall back to the filter path).
+            spliced = Path(tmpdir) / "clean.m4a"
+            if splice_silence_into_aac(input_video, spliced, mute_intervals):
+                clean_audio = spliced
+
+        cmd = _build_ffmpeg_censor_and_mux_cmd(
+            input_video=input_video,
+            output_video=output_video,
+            spans=spans,
+            config=config,
+            primary_audio_codec=probe.codec_name,
+            primary_audio_bit_rate=probe.bit_rate,
+            input_audio_stream_count=probe.stream_count,
+            clean_audio=clean_audio,
+            work_dir=Path(tmpdir),
+        )
 
-    logger.info("Running ffmpeg for final mux: %s", " ".join(cmd))
-    result = subprocess.run(
-        cmd,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        text=True,
-    )
+        logger.info("Running ffmpeg for final mux: %s", _LazyJoin(cmd))
+        # Only stderr is read (on failure); stdout is discarded, not buffered.
+        result = subprocess.run(
+            cmd,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+        )
 
     if result.returncode != 0:
         raise RuntimeError(
-            f"ffmpeg muxing failed with code {result.returncode}: {result.stderr}"
+            f"ffmpeg muxing failed with code {result.returncode}: {_decode_stderr(result.stderr)}"
         )
+
@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from src import aac_splice
+from src.aac_splice import IntervalCursor, splice_silence_into_aac
+
+
+def test_interval_cursor_flags_packets_overlapping_intervals():
+    cursor = IntervalCursor([(1.0, 2.0), (5.0, 5.5)])
+    packets = [(0.0, 0.9), (0.9, 1.1), (1.5, 1.6), (2.0, 2.1), (4.9, 5.0), (5.4, 6.0), (7.0, 8.0)]
+
+    assert [cursor.overlaps(start, end) for start, end in packets] == [
+        False,
+        True,
+        True,
+        False,
+        False,
+        True,
+        False,
+    ]
+
+
+def test_splice_falls_back_without_pyav(monkeypatch, tmp_path: Path):
+    monkeypatch.setattr(aac_splice, "_import_av", lambda: None)
+
+    assert splice_silence_into_aac(tmp_path / "in.mp4", tmp_path / "clean.m4a", [(1.0, 2.0)]) is False
@@ -1,12 +1,19 @@
 from __future__ import annotations
 
+import io
+import struct
 import tempfile
 import wave
 from pathlib import Path
 
 import pytest
 
-from src.audio_tools import chunk_audio
+from src.audio_tools import (
+    _compute_duration_seconds,
+    chunk_audio,
+    extract_and_chunk,
+    stream_pcm_chunks,
+)
 
 
 def _create_dummy_wav(path: Path, duration_sec: float = 2.0, sample_rate: int = 16000) -> None:
@@ -36,3 +43,111 @@ def test_chunk_audio_splits_into_expected_chunks():
         assert chunks[0].duration > 0
         assert chunks[1].duration > 0
 
+
+def test_chunk_audio_slices_pcm_after_extra_riff_chunks(tmp_path: Path):
+    pcm = bytes(range(256)) * 125  # 32000 bytes = 1s of 16-bit mono @ 16 kHz
+    fmt = struct.pack("<HHIIHH", 1, 1, 16000, 32000, 2, 16)
+    body = (
+        b"WAVE"
+        + b"fmt " + struct.pack("<I", len(fmt)) + fmt
+        + b"LIST" + struct.pack("<I", 5) + b"INFO\x00\x00"  # odd size + pad byte
+        + b"data" + struct.pack("<I", len(pcm)) + pcm
+    )
+    wav_path = tmp_path / "audio.wav"
+    wav_path.write_bytes(b"RIFF" + struct.pack("<I", len(body)) + body)
+
+    chunks = chunk_audio(wav_path, chunk_length_seconds=0.5, temp_dir=tmp_path / "chunks")
+
+    assert [c.index for c in chunks] == [0, 1]
+    with wave.open(str(chunks[1].path), "rb") as wf:
+        assert wf.readframes(wf.getnframes()) == pcm[16000:]
+
+
+def test_compute_duration_seconds(tmp_path: Path):
+    wav_path = tmp_path / "audio.wav"
+    _create_dummy_wav(wav_path, duration_sec=2.05, sample_rate=16000)
+
+    assert _compute_duration_seconds(wav_path) == pytest.approx(2.05)
+
+
+def test_extract_and_chunk_yields_chunks_from_ffmpeg_segment_list(monkeypatch, tmp_path: Path):
+    chunks_dir = tmp_path / "chunks"
+    debug_wav = tmp_path / "audio_debug" / "audio.wav"
+    calls = []
+
+    class FakePopen:
+        def __init__(self, cmd, stdout, stderr, text):  # noqa: ANN001
+            calls.append(cmd)
+            # ffmpeg's csv segment list: name,start,end per finished segment,
+            # including a 50 ms tail that must be skipped.
+            self.stdout = io.StringIO(
+                "chunk_000.wav,0.000000,300.000000\n"
+                "chunk_001.wav,300.000000,512.250000\n"
+                "chunk_002.wav,512.250000,512.300000\n"
+            )
+            self.returncode = None
+
+        def wait(self):
+            self.returncode = 0
+            return 0
+
+        def poll(self):
+            return self.returncode
+
+    monkeypatch.setattr("src.audio_tools.subprocess.Popen", FakePopen)
+
+    chunks = list(
+        extract_and_chunk(
+            Path("movie.mp4"),
+            chunks_dir,
+            chunk_length_seconds=300,
+            debug_audio_path=debug_wav,
+        )
+    )
+
+    assert len(calls) == 1
+    cmd = calls[0]
+    assert cmd[0] == "ffmpeg"
+    assert cmd[cmd.index("-loglevel") + 1] == "error"
+    assert cmd[cmd.index("-i") + 1] == "movie.mp4"
+    assert str(chunks_dir / "chunk_%03d.wav") in cmd
+    assert cmd[-1] == str(debug_wav)
+
+    assert [c.index for c in chunks] == [0, 1]
+    assert chunks[1].path == chunks_dir / "chunk_001.wav"
+    assert chunks[1].start_time == pytest.approx(300.0)
+    assert chunks[1].duration == pytest.approx(212.25)
+
+
+def test_stream_pcm_chunks_yields_in_memory_wav_chunks(monkeypatch):
+    sample_rate = 16000
+    # 2.5 seconds of PCM -> chunks of 1s, 1s, 0.5s
+    pcm = b"\x01\x00" * int(2.5 * sample_rate)
+
+    class FakePopen:
+        def __init__(self, cmd, stdout, stderr, text):  # noqa: ANN001
+            assert cmd[-3:] == ["-f", "s16le", "pipe:1"]
+            self.stdout = io.BytesIO(pcm)
+            self.returncode = None
+
+        def wait(self):
+            self.returncode = 0
+            return 0
+
+        def poll(self):
+            return self.returncode
+
+    monkeypatch.setattr("src.audio_tools.subprocess.Popen", FakePopen)
+
+    chunks = list(stream_pcm_chunks(Path("movie.mp4"), chunk_length_seconds=1, sample_rate=sample_rate))
+
+    assert [c.index for c in chunks] == [0, 1, 2]
+    assert all(c.path is None for c in chunks)
+    assert chunks[2].start_time == pytest.approx(2.0)
+    assert chunks[2].duration == pytest.approx(0.5)
+
+    # Each chunk is a self-contained WAV the backends can read.
+    with wave.open(io.BytesIO(chunks[2].data), "rb") as wf:
+        assert wf.getnchannels() == 1
+        assert wf.getframerate() == sample_rate
+        assert wf.getnframes() == int(0.5 * sample_rate)
@@ -10,3 +10,31 @@ def test_load_default_profanity_list_en_language():
     assert all(isinstance(w, str) for w in words)
     assert all(w == w.lower() for w in words), "Expected all words to be lowercase"
 
+
+def test_app_config_resolves_paths_once(tmp_path, monkeypatch):
+    from pathlib import Path
+
+    from src.config import AppConfig
+
+    monkeypatch.chdir(tmp_path)
+    cfg = AppConfig(input_path=Path("in.mp4"), output_path=Path("out.mp4"), output_dir=Path("logs"))
+
+    assert cfg.input_path == (tmp_path / "in.mp4").resolve()
+    assert cfg.output_path.is_absolute()
+    assert cfg.output_dir == (tmp_path / "logs").resolve()
+    assert cfg.profanity_list_path is None
+
+
+def test_app_config_normalizes_profanity_terms_once():
+    from pathlib import Path
+
+    from src.config import AppConfig
+
+    cfg = AppConfig(
+        input_path=Path("in.mp4"),
+        output_path=Path("out.mp4"),
+        profanity_terms=[" Fuck ", "shit", "FUCK", "", "son of a bitch"],
+    )
+
+    assert cfg.profanity_terms == ["fuck", "shit", "son of a bitch"]
+    assert cfg.profanity_set == frozenset({"fuck", "shit", "son of a bitch"})
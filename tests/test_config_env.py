@@ -154,3 +154,40 @@ def test_non_canonical_whisper_backend_env_raises(tmp_path, monkeypatch, raw):
 
     with pytest.raises(ValueError, match=r"Expected one of: local_whisper, openai_api"):
         load_config_from_args(args)
+
+
+def test_dotenv_cache_reuses_parse_until_file_changes(tmp_path, monkeypatch):
+    import os
+
+    from src import config as config_mod
+
+    env_file = tmp_path / ".env"
+    env_file.write_text("DIALOGSAFE_TEST_VAR=one\n", encoding="utf-8")
+    monkeypatch.delenv("DIALOGSAFE_TEST_VAR", raising=False)
+    monkeypatch.setattr(config_mod, "_DOTENV_CACHE", {})
+
+    calls = []
+    real_dotenv_values = config_mod.dotenv_values
+
+    def counting_dotenv_values(path):  # noqa: ANN001
+        calls.append(path)
+        return real_dotenv_values(path)
+
+    monkeypatch.setattr(config_mod, "dotenv_values", counting_dotenv_values)
+
+    config_mod._load_dotenv_cached(env_file)
+    assert os.environ["DIALOGSAFE_TEST_VAR"] == "one"
+
+    # Existing env wins; an unchanged file is not re-parsed.
+    monkeypatch.setenv("DIALOGSAFE_TEST_VAR", "from-shell")
+    config_mod._load_dotenv_cached(env_file)
+    assert os.environ["DIALOGSAFE_TEST_VAR"] == "from-shell"
+    assert len(calls) == 1
+
+    monkeypatch.delenv("DIALOGSAFE_TEST_VAR")
+    env_file.write_text("DIALOGSAFE_TEST_VAR=two\n", encoding="utf-8")
+    st = env_file.stat()
+    os.utime(env_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    config_mod._load_dotenv_cached(env_file)
+    assert os.environ["DIALOGSAFE_TEST_VAR"] == "two"
+    assert len(calls) == 2
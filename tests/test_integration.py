@@ -78,8 +78,7 @@ def _patch_pipeline(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> tuple[Pa
     Common patching logic for integration tests.
 
     Patches the functions that src.main.run_pipeline imports directly:
-      - extract_mono_pcm_audio
-      - chunk_audio
+      - extract_and_chunk / stream_pcm_chunks
       - transcribe_audio_chunks
       - apply_audio_filters_and_mux
 
@@ -91,19 +90,21 @@ def _patch_pipeline(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> tuple[Pa
 
     input_video.write_bytes(b"dummy-video-content")
 
-    # Patch extract_mono_pcm_audio: create a dummy wav and return its path.
-    def fake_extract(input_video_path: Path, output_wav: Path, sample_rate: int = 16000) -> Path:
-        _make_dummy_wav(output_wav, duration_sec=1.0, sample_rate=sample_rate)
-        return output_wav
-
-    monkeypatch.setattr(main_mod, "extract_mono_pcm_audio", fake_extract)
-
-    # Patch chunk_audio: return a single AudioChunk pointing at the dummy wav.
-    def fake_chunk_audio(input_wav: Path, chunk_length_seconds: int, temp_dir: Path) -> list[AudioChunk]:
-        temp_dir.mkdir(parents=True, exist_ok=True)
-        chunk_path = temp_dir / "chunk_000.wav"
+    # Patch extract_and_chunk: return a single AudioChunk pointing at a dummy wav.
+    def fake_extract_and_chunk(
+        input_video_path: Path,
+        chunks_dir: Path,
+        chunk_length_seconds: int,
+        sample_rate: int = 16000,
+        *,
+        debug_audio_path: Path | None = None,
+    ) -> list[AudioChunk]:
+        chunks_dir.mkdir(parents=True, exist_ok=True)
+        chunk_path = chunks_dir / "chunk_000.wav"
         if not chunk_path.exists():
-            _make_dummy_wav(chunk_path, duration_sec=1.0, sample_rate=16000)
+            _make_dummy_wav(chunk_path, duration_sec=1.0, sample_rate=sample_rate)
+        if debug_audio_path is not None:
+            _make_dummy_wav(debug_audio_path, duration_sec=1.0, sample_rate=sample_rate)
         return [
             AudioChunk(
                 index=0,
@@ -113,7 +114,27 @@ def _patch_pipeline(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> tuple[Pa
             )
         ]
 
-    monkeypatch.setattr(main_mod, "chunk_audio", fake_chunk_audio)
+    monkeypatch.setattr(main_mod, "extract_and_chunk", fake_extract_and_chunk)
+
+    # Patch stream_pcm_chunks (default, no-disk path): a single in-memory chunk.
+    def fake_stream_pcm_chunks(
+        input_video_path: Path,
+        chunk_length_seconds: int,
+        sample_rate: int = 16000,
+    ) -> list[AudioChunk]:
+        wav_path = tmp_path / "in_memory_chunk.wav"
+        _make_dummy_wav(wav_path, duration_sec=1.0, sample_rate=sample_rate)
+        return [
+            AudioChunk(
+                index=0,
+                path=None,
+                start_time=0.0,
+                duration=1.0,
+                data=wav_path.read_bytes(),
+            )
+        ]
+
+    monkeypatch.setattr(main_mod, "stream_pcm_chunks", fake_stream_pcm_chunks)
 
     # Patch transcribe_audio_chunks: avoid real OpenAI calls.
     def fake_transcribe_audio_chunks(
@@ -147,8 +168,7 @@ def test_full_pipeline_mute_mode(monkeypatch: pytest.MonkeyPatch, tmp_path: Path
     End-to-end test for the main pipeline in mute mode.
 
     Uses the real CLI entrypoint but patches:
-      - ffmpeg audio extraction
-      - audio chunking
+      - ffmpeg audio extraction + chunking
       - OpenAI STT
       - final ffmpeg mux
 
@@ -260,9 +280,10 @@ def test_pipeline_skips_when_clean_marker_present(monkeypatch: pytest.MonkeyPatc
 
     # If the pipeline is not skipped, these would be called.
     def fail_extract(*_args, **_kwargs):  # noqa: ANN001
-        raise AssertionError("extract_mono_pcm_audio should not be called when skipping")
+        raise AssertionError("audio extraction should not be called when skipping")
 
-    monkeypatch.setattr(main_mod, "extract_mono_pcm_audio", fail_extract)
+    monkeypatch.setattr(main_mod, "extract_and_chunk", fail_extract)
+    monkeypatch.setattr(main_mod, "stream_pcm_chunks", fail_extract)
 
     argv = [
         "--input",
@@ -276,3 +297,72 @@ def test_pipeline_skips_when_clean_marker_present(monkeypatch: pytest.MonkeyPatc
     exit_code = main_mod.main(argv)
     assert exit_code == 0
     assert not output_video.exists()
+
+
+@pytest.mark.integration
+def test_debug_dump_audio_links_chunks_into_output_dir(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    input_video, output_video, out_dir = _patch_pipeline(monkeypatch, tmp_path)
+
+    argv = [
+        "--input",
+        str(input_video),
+        "--output",
+        str(output_video),
+        "--output-dir",
+        str(out_dir),
+        "--debug-dump-audio",
+    ]
+
+    assert main_mod.main(argv) == 0
+
+    debug_dir = out_dir / "audio_debug"
+    assert (debug_dir / "audio.wav").exists()
+    # The temp chunk file is gone, but the linked (or copied) debug file survives.
+    assert (debug_dir / "chunk_000.wav").stat().st_size > 0
+
+
+@pytest.mark.integration
+def test_second_run_reuses_cached_transcript(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    input_video, output_video, out_dir = _patch_pipeline(monkeypatch, tmp_path)
+    argv = [
+        "--input",
+        str(input_video),
+        "--output",
+        str(output_video),
+        "--output-dir",
+        str(out_dir),
+        "--min-confidence",
+        "0.0",
+    ]
+
+    assert main_mod.main(argv) == 0
+    assert list((out_dir / "transcript_cache").glob("input-*.json"))
+
+    def fail_transcribe(*args, **kwargs):  # noqa: ANN002, ANN003
+        raise AssertionError("transcription should be served from the cache")
+
+    monkeypatch.setattr(main_mod, "transcribe_audio_chunks", fail_transcribe)
+
+    # Different detection settings still hit the cache.
+    assert main_mod.main(argv + ["--max-gap-combine-ms", "100"]) == 0
+    words = {e["word"] for e in json.loads((out_dir / "censor_log.json").read_text(encoding="utf-8"))}
+    assert "fuck" in words
+
+    # Opting out re-transcribes.
+    assert main_mod.main(argv + ["--no-transcript-cache"]) == 1
+
+
+@pytest.mark.integration
+def test_incomplete_transcript_is_not_cached(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    input_video, output_video, out_dir = _patch_pipeline(monkeypatch, tmp_path)
+
+    def partial_transcribe(*args, **kwargs):  # noqa: ANN002, ANN003
+        result = _fake_transcription_result()
+        result.failed_chunks = 1
+        return result
+
+    monkeypatch.setattr(main_mod, "transcribe_audio_chunks", partial_transcribe)
+
+    argv = ["--input", str(input_video), "--output", str(output_video), "--output-dir", str(out_dir)]
+    assert main_mod.main(argv) == 0
+    assert not list((out_dir / "transcript_cache").glob("input-*.json"))
@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from src import json_io
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_write_and_read_json_round_trip(monkeypatch, tmp_path: Path, use_orjson: bool):
+    if use_orjson:
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(json_io, "orjson", None)
+
+    data = [{"word": "scheiße", "start": 10.0, "end": 10.5, "confidence": 0.9, "context": ""}]
+    path = tmp_path / "log.json"
+    json_io.write_json(path, data)
+
+    text = path.read_text(encoding="utf-8")
+    assert '"start": 10.0' in text
+    assert "scheiße" in text  # not \u-escaped
+    assert text.startswith('[\n  {\n    "word"')
+    assert json_io.read_json(path) == data
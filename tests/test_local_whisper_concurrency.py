@@ -40,7 +40,7 @@ def test_local_whisper_transcribe_is_serialized_per_model(monkeypatch, tmp_path)
     fake_model = FakeModel()
 
     # Ensure we don't inherit state from other tests.
-    lw._local_whisper_transcribe_locks.clear()
+    lw._local_whisper_queues.clear()
 
     monkeypatch.setattr(lw, "_get_local_whisper_model", lambda _model_name: fake_model)
 
@@ -59,3 +59,20 @@ def test_local_whisper_transcribe_is_serialized_per_model(monkeypatch, tmp_path)
         {"language": "en", "segments": []},
     ]
 
+
+def test_local_whisper_transcribe_errors_reach_the_caller(monkeypatch, tmp_path):
+    import pytest
+
+    from src.transcription_backends import local_whisper as lw
+
+    class FailingModel:
+        def transcribe(self, *_args, **_kwargs):
+            raise ValueError("bad audio")
+
+    lw._local_whisper_queues.clear()
+    monkeypatch.setattr(lw, "_get_local_whisper_model", lambda _model_name: FailingModel())
+
+    # The model's consumer thread survives a failure and serves later calls.
+    for _ in range(2):
+        with pytest.raises(ValueError, match="bad audio"):
+            lw.transcribe_audio(tmp_path / "chunk.wav", language="en", model="base")
@@ -57,3 +57,33 @@ def test_profane_segment_flow_to_spans_and_clean_text():
     assert "shit" not in clean.lower()
     assert "****" in clean
 
+
+def test_effective_workers_caps_local_whisper_by_cpu_and_memory(monkeypatch):
+    from src import main as main_mod
+
+    monkeypatch.setattr(main_mod, "_available_cpus", lambda: 16)
+    # Room for three "small" models (466 MB each).
+    monkeypatch.setattr(main_mod, "_available_memory_bytes", lambda: 1500 * 1024 * 1024)
+
+    cfg = _dummy_config(whisper_backend="local_whisper", whisper_model="small", chunk_workers=8)
+    assert main_mod.effective_workers(cfg) == 3
+
+    # "whisper-1" is loaded locally as "base" (142 MB), so ten fit.
+    cfg = _dummy_config(whisper_backend="local_whisper", whisper_model="whisper-1", chunk_workers=16)
+    assert main_mod.effective_workers(cfg) == 10
+
+    # Remote backend: no local model, so the configured count is used as-is.
+    cfg = _dummy_config(whisper_backend="openai_api", whisper_model="whisper-1", chunk_workers=8)
+    assert main_mod.effective_workers(cfg) == 8
+
+    # Unset: one request per CPU, at most eight.
+    monkeypatch.setattr(main_mod.os, "cpu_count", lambda: 12)
+    cfg = _dummy_config(whisper_backend="openai_api", whisper_model="whisper-1", chunk_workers=None)
+    assert main_mod.effective_workers(cfg) == 8
+    monkeypatch.setattr(main_mod.os, "cpu_count", lambda: 2)
+    assert main_mod.effective_workers(cfg) == 2
+
+    # Never below one worker, even when the model does not fit.
+    monkeypatch.setattr(main_mod, "_available_memory_bytes", lambda: 0)
+    cfg = _dummy_config(whisper_backend="local_whisper", whisper_model="large-v3")
+    assert main_mod.effective_workers(cfg) == 1
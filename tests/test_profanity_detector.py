@@ -13,7 +13,14 @@ from src.domain import (
     ProfanitySpan,
     ProfanityTerm,
 )
-from src.profanity_detector import build_censor_log, detect_profanity, load_profanity_terms, merge_profanity_spans
+from src.profanity_detector import (
+    _format_srt_timestamp,
+    build_censor_log,
+    build_subtitles,
+    detect_profanity,
+    load_profanity_terms,
+    merge_profanity_spans,
+)
 
 
 def _dummy_config(**overrides) -> AppConfig:
@@ -44,6 +51,10 @@ def test_load_profanity_terms_wraps_config_terms():
     assert all(isinstance(t, ProfanityTerm) for t in terms)
     assert all(t.text for t in terms)
     assert all(t.text == t.text.lower() for t in terms)
+    # Same term list -> the same (already compiled) terms, in a fresh list.
+    again = load_profanity_terms(_dummy_config())
+    assert again == terms and again is not terms
+    assert all(a is b for a, b in zip(again, terms))
 
 
 def test_detect_profanity_respects_word_boundaries():
@@ -102,6 +113,48 @@ def test_detect_profanity_keeps_low_confidence_profane_tokens_in_mute_mode():
     assert hits[0].end == pytest.approx(4203.38)
 
 
+def test_detect_profanity_segment_fallback_matches_all_terms_in_one_pass():
+    cfg = _dummy_config(min_confidence=0.0)
+    terms = [ProfanityTerm(text="ass"), ProfanityTerm(text="fuck"), ProfanityTerm(text="fucking")]
+
+    seg = TranscriptSegment(
+        id=3,
+        start=10.0,
+        end=12.0,
+        text="Classy? FUCKING ass, fuck.",
+        words=[],
+        avg_confidence=0.8,
+        chunk_index=1,
+    )
+    result = TranscriptionResult(segments=[seg], language="en", raw_responses=[])
+
+    hits = detect_profanity(result, terms, cfg)
+    assert [h.word for h in hits] == ["fucking", "ass", "fuck"]
+    assert all((h.start, h.end) == (10.0, 12.0) for h in hits)
+
+
+def test_detect_profanity_drops_low_confidence_tokens_outside_mute_mode():
+    cfg = _dummy_config(min_confidence=0.6, mode="bleep")
+    terms = [ProfanityTerm(text="shit"), ProfanityTerm(text="ass")]
+
+    seg = TranscriptSegment(
+        id=0,
+        start=0.0,
+        end=2.0,
+        text="shit, ass",
+        words=[
+            TranscriptWord(word="shit,", start=0.0, end=0.5, confidence=0.3),
+            TranscriptWord(word="Ass", start=0.5, end=1.0, confidence=0.9),
+        ],
+        avg_confidence=0.6,
+        chunk_index=0,
+    )
+    result = TranscriptionResult(segments=[seg], language="en", raw_responses=[])
+
+    hits = detect_profanity(result, terms, cfg)
+    assert [(h.word, h.start) for h in hits] == [("ass", 0.5)]
+
+
 def test_merge_profanity_spans_merges_close_hits():
     hits = [
         # first cluster
@@ -119,6 +172,32 @@ def test_merge_profanity_spans_merges_close_hits():
     assert second.start == pytest.approx(5.0)
 
 
+def test_merge_profanity_spans_sorts_unordered_hits_first():
+    def hit(word: str, start: float) -> ProfanityHit:
+        return ProfanityHit(
+            word=word, start=start, end=start + 0.2, confidence=0.9, context="", segment_id=0, chunk_index=0
+        )
+
+    spans = merge_profanity_spans([hit("c", 5.0), hit("a", 1.0), hit("b", 1.3)], max_gap_ms=500)
+    assert [(s.start, [h.word for h in s.hits]) for s in spans] == [(1.0, ["a", "b"]), (5.0, ["c"])]
+
+
+def test_merge_profanity_spans_records_first_best_hit():
+    def hit(word: str, start: float, confidence: float) -> ProfanityHit:
+        return ProfanityHit(
+            word=word, start=start, end=start + 0.1, confidence=confidence, context="", segment_id=0, chunk_index=0
+        )
+
+    hits = [hit("a", 1.0, 0.7), hit("b", 1.1, 0.95), hit("c", 1.2, 0.95)]
+
+    (span,) = merge_profanity_spans(hits, max_gap_ms=500)
+    assert span.best_hit_index == 1
+    assert span.max_confidence == 0.95
+    assert span.best_hit is hits[1]
+    # Hand-built spans without an index fall back to scanning the hits.
+    assert ProfanitySpan(start=1.0, end=1.3, hits=hits, max_confidence=0.95).representative_word == "b"
+
+
 def test_build_censor_log_creates_expected_json(tmp_path: Path):
     span = ProfanitySpan(
         start=10.0,
@@ -133,3 +212,100 @@ def test_build_censor_log_creates_expected_json(tmp_path: Path):
     content = log_path.read_text(encoding="utf-8")
     assert '"start": 10.0' in content
     assert '"end": 11.0' in content
+
+
+def test_profanity_term_build_union_matches_any_term_with_word_boundaries():
+    union = ProfanityTerm.build_union([ProfanityTerm(text="ass"), ProfanityTerm(text="damn")])
+
+    assert [m.group(0) for m in union.finditer("Classy DAMN ass-hat")] == ["DAMN", "ass"]
+
+
+def test_build_subtitles_masks_profanity_in_context(tmp_path: Path):
+    def span(start: float, word: str, context: str) -> ProfanitySpan:
+        hit = ProfanityHit(
+            word=word, start=start, end=start + 0.5, confidence=0.9, context=context, segment_id=0, chunk_index=0
+        )
+        return ProfanitySpan(start=start, end=start + 0.5, hits=[hit], max_confidence=0.9)
+
+    spans = [
+        span(1.0, "shit", "Oh SHIT, classy."),
+        span(3661.25, "ass", "what an ass"),
+    ]
+    srt_path = tmp_path / "subs.srt"
+    build_subtitles(spans, TranscriptionResult(segments=[], language="en", raw_responses=[]), srt_path)
+
+    lines = srt_path.read_text(encoding="utf-8").splitlines()
+    assert lines[:3] == ["1", "00:00:01,000 --> 00:00:01,500", "Oh ****, classy."]
+    assert lines[4:7] == ["2", "01:01:01,250 --> 01:01:01,750", "what an ****"]
+
+
+def test_build_subtitles_masks_only_each_spans_own_hits(tmp_path: Path):
+    def span(start: float, word: str, context: str) -> ProfanitySpan:
+        hit = ProfanityHit(
+            word=word, start=start, end=start + 0.5, confidence=0.9, context=context, segment_id=0, chunk_index=0
+        )
+        return ProfanitySpan(start=start, end=start + 0.5, hits=[hit], max_confidence=0.9)
+
+    # "ass" was only censored in the second span, so the first context keeps it.
+    spans = [span(1.0, "shit", "shit, kiss my ass"), span(2.0, "ass", "kiss my ass")]
+    srt_path = tmp_path / "subs.srt"
+    build_subtitles(spans, TranscriptionResult(segments=[], language="en", raw_responses=[]), srt_path)
+
+    lines = srt_path.read_text(encoding="utf-8").splitlines()
+    assert lines[2] == "****, kiss my ass"
+    assert lines[6] == "kiss my ****"
+
+
+def test_profanity_matcher_automaton_agrees_with_regex():
+    pytest.importorskip("ahocorasick")
+    from dataclasses import replace
+
+    from src.domain import build_matcher
+
+    matcher = build_matcher(["ass", "fuck", "fucking", "son of a bitch", "a$$"])
+    assert matcher.automaton is not None
+    regex_only = replace(matcher, automaton=None)
+
+    for text in [
+        "Classy? FUCKING ass, fuck.",
+        "you son of a bitch, son of a bitching",
+        "bad a$$ move, a$$hole",
+        "fuckfuck ass_ ass's _ass",
+        "İstanbul ass",  # lowercasing changes length -> regex fallback
+    ]:
+        assert list(matcher.iter_matches(text)) == list(regex_only.iter_matches(text)), text
+
+
+def test_build_matcher_reuses_compiled_matcher_for_same_term_set():
+    from src.domain import build_matcher
+
+    first = build_matcher(["shit", "fuck", "shit"])
+    assert build_matcher([" FUCK", "shit"]) is first
+    assert build_matcher(["fuck"]) is not first
+
+
+@pytest.mark.parametrize(
+    ("seconds", "expected"),
+    [
+        (0.0, "00:00:00,000"),
+        (-1.0, "00:00:00,000"),
+        (61.25, "00:01:01,250"),
+        (1.9996, "00:00:02,000"),  # rounds up into the next second, not ",1000"
+        (3599.9999, "01:00:00,000"),
+        (36000.5, "10:00:00,500"),
+    ],
+)
+def test_format_srt_timestamp(seconds: float, expected: str):
+    assert _format_srt_timestamp(seconds) == expected
+
+
+@pytest.mark.parametrize(
+    ("raw", "expected"),
+    [("Fuck!", "fuck"), ("don't,", "don't"), ("B.S.", "bs"), ("Scheiße?", "scheiße"), ("“shit”", "shit"), ("...", "")],
+)
+def test_token_normalize_matches_regex_rule(raw: str, expected: str):
+    import re
+
+    from src.profanity_detector import _token_normalize
+
+    assert _token_normalize(raw) == expected == re.sub(r"[^\w']+", "", raw.lower())
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import json
+import time
 from pathlib import Path
 
 import pytest
@@ -93,6 +95,33 @@ def test_build_clean_transcript_masks_profanity_spans():
     assert "fuck" not in clean.lower()
 
 
+def test_build_clean_transcript_handles_nested_and_unsorted_spans():
+    words = [
+        TranscriptWord(word=w, start=t, end=t + 0.2, confidence=1.0)
+        for w, t in [("a", 0.5), ("b", 4.0), ("c", 5.5), ("d", 6.5), ("e", 8.0)]
+    ]
+    seg = TranscriptSegment(
+        id=0, start=0.0, end=9.0, text="a b c d e", words=words, avg_confidence=1.0, chunk_index=0
+    )
+    result = TranscriptionResult(segments=[seg], language="en", raw_responses=[])
+
+    # (2, 3) sits inside (1, 5): a span ending early must not hide the outer one.
+    spans = [{"start": 6.0, "end": 7.0}, {"start": 2.0, "end": 3.0}, {"start": 1.0, "end": 5.0}]
+
+    assert build_clean_transcript(result, spans) == "a **** c **** e"
+
+
+def test_build_clean_transcript_masks_words_that_contain_a_short_span():
+    words = [TranscriptWord(word="motherfucker", start=1.0, end=2.0, confidence=1.0)]
+    seg = TranscriptSegment(
+        id=0, start=0.0, end=2.0, text="motherfucker", words=words, avg_confidence=1.0, chunk_index=0
+    )
+    result = TranscriptionResult(segments=[seg], language="en", raw_responses=[])
+
+    # Neither word edge falls inside the span, but the word overlaps it.
+    assert build_clean_transcript(result, [{"start": 1.4, "end": 1.6}]) == "****"
+
+
 def test_transcribe_chunk_local_backend_translates_default_model(monkeypatch: pytest.MonkeyPatch):
     """When using local Whisper, the OpenAI default model name is translated."""
 
@@ -130,3 +159,205 @@ def test_transcribe_chunk_openai_backend_keeps_default_model(monkeypatch: pytest
     assert res["language"] == "en"
     assert captured["model"] == "whisper-1"
 
+
+def test_transcribe_audio_chunks_reassembles_results_in_chunk_order(monkeypatch: pytest.MonkeyPatch):
+    import asyncio
+    import contextlib
+
+    cfg = _dummy_config(whisper_backend="openai_api")
+    chunks = [
+        AudioChunk(index=i, path=Path(f"chunk_{i:03d}.wav"), start_time=i * 300.0, duration=300.0)
+        for i in range(3)
+    ]
+    in_flight = {"now": 0, "max": 0}
+
+    async def fake_transcribe_chunk_async(chunk: AudioChunk, config: AppConfig, client):
+        in_flight["now"] += 1
+        in_flight["max"] = max(in_flight["max"], in_flight["now"])
+        # Finish later chunks first to exercise out-of-order completion.
+        await asyncio.sleep(0.01 * (len(chunks) - chunk.index))
+        in_flight["now"] -= 1
+        return {"chunk_index": chunk.index, "language": "en", "segments": [], "raw": {"i": chunk.index}}
+
+    monkeypatch.setattr(transcriber_mod, "transcribe_chunk_async", fake_transcribe_chunk_async)
+    monkeypatch.setattr(
+        transcriber_mod, "_openai_api_new_async_client", lambda max_connections: contextlib.nullcontext()
+    )
+
+    result = transcriber_mod.transcribe_audio_chunks(iter(chunks), cfg, max_workers=2)
+    assert result.language == "en"
+    assert result.raw_responses == [{"i": 0}, {"i": 1}, {"i": 2}]
+    assert in_flight["max"] == 2
+
+
+def test_transcribe_audio_chunks_local_backend_uses_worker_pool(monkeypatch: pytest.MonkeyPatch):
+    cfg = _dummy_config(whisper_backend="local_whisper")
+    chunks = [
+        AudioChunk(index=i, path=Path(f"chunk_{i:03d}.wav"), start_time=i * 300.0, duration=300.0)
+        for i in range(2)
+    ]
+
+    def fake_transcribe_chunk(chunk: AudioChunk, config: AppConfig):
+        return {"chunk_index": chunk.index, "language": "en", "segments": [], "raw": {"i": chunk.index}}
+
+    monkeypatch.setattr(transcriber_mod, "transcribe_chunk", fake_transcribe_chunk)
+
+    # One worker stays on an in-process thread pool, so the patch applies.
+    result = transcriber_mod.transcribe_audio_chunks(chunks, cfg, max_workers=1)
+    assert result.raw_responses == [{"i": 0}, {"i": 1}]
+    assert result.failed_chunks == 0
+
+
+def test_transcribe_audio_chunks_counts_failed_chunks(monkeypatch: pytest.MonkeyPatch):
+    cfg = _dummy_config(whisper_backend="local_whisper")
+    chunks = [
+        AudioChunk(index=i, path=Path(f"chunk_{i:03d}.wav"), start_time=i * 300.0, duration=300.0)
+        for i in range(3)
+    ]
+
+    def fake_transcribe_chunk(chunk: AudioChunk, config: AppConfig):
+        if chunk.index == 1:
+            raise RuntimeError("boom")
+        return {"chunk_index": chunk.index, "language": "en", "segments": [], "raw": {"i": chunk.index}}
+
+    monkeypatch.setattr(transcriber_mod, "transcribe_chunk", fake_transcribe_chunk)
+
+    result = transcriber_mod.transcribe_audio_chunks(chunks, cfg, max_workers=1)
+    assert result.raw_responses == [{"i": 0}, {"i": 2}]
+    assert result.failed_chunks == 1
+
+
+def test_save_transcript_json_round_trips_through_load(tmp_path: Path):
+    from dataclasses import asdict
+
+    from src.transcriber import load_transcript_json, save_transcript_json
+
+    seg = TranscriptSegment(
+        id=3,
+        start=1.0,
+        end=2.0,
+        text="oh shit",
+        words=[
+            TranscriptWord(word="oh", start=1.0, end=1.2, confidence=0.9),
+            TranscriptWord(word="shit", start=1.2, end=2.0, confidence=0.8),
+        ],
+        avg_confidence=0.85,
+        chunk_index=1,
+    )
+    path = tmp_path / "transcript.json"
+    save_transcript_json(TranscriptionResult(segments=[seg], language="en", raw_responses=[]), path)
+
+    # Same shape (and key order) as the previous asdict-based output.
+    assert json.loads(path.read_text(encoding="utf-8"))["segments"] == [asdict(seg)]
+    assert list(json.loads(path.read_text(encoding="utf-8"))["segments"][0]) == list(asdict(seg))
+
+    loaded = load_transcript_json(path)
+    assert loaded.language == "en"
+    assert loaded.segments == [seg]
+
+
+def test_parse_transcript_response_defaults_missing_fields_and_skips_malformed_segments():
+    chunk = AudioChunk(index=1, path=Path("dummy.wav"), start_time=100.0, duration=5.0)
+    raw = {
+        "language": "en",
+        "segments": [
+            {"start": 1.0, "end": "not a number", "text": "broken"},
+            {"start": 2.0, "text": "ok", "words": [{"word": "ok", "end": 2.5, "confidence": None}]},
+        ],
+    }
+
+    _, segments = transcriber_mod._parse_transcript_response(raw, chunk, chunk_index=1)  # type: ignore[attr-defined]
+
+    assert len(segments) == 1
+    seg = segments[0]
+    assert (seg.id, seg.start, seg.end) == (0, 102.0, 102.0)
+    assert seg.words == [TranscriptWord(word="ok", start=102.0, end=102.5, confidence=1.0)]
+    assert seg.avg_confidence == 1.0
+
+
+def test_parse_transcript_response_skips_only_the_malformed_word():
+    from src.profanity_detector import detect_profanity, load_profanity_terms
+
+    chunk = AudioChunk(index=0, path=Path("dummy.wav"), start_time=0.0, duration=5.0)
+    raw = {
+        "language": "en",
+        "segments": [
+            {
+                "id": 0,
+                "start": 0.0,
+                "end": 2.0,
+                "text": "oh shit",
+                "words": [
+                    {"word": "oh", "start": 0.0, "end": 0.5, "confidence": "n/a"},
+                    {"word": "shit", "start": 0.5, "end": 1.0, "confidence": 0.9},
+                ],
+            }
+        ],
+    }
+
+    language, segments = transcriber_mod._parse_transcript_response(raw, chunk, chunk_index=0)  # type: ignore[attr-defined]
+
+    assert [w.word for w in segments[0].words] == ["shit"]
+    result = TranscriptionResult(segments=segments, language=language, raw_responses=[])
+    cfg = _dummy_config()
+    hits = detect_profanity(result, load_profanity_terms(cfg), cfg)
+    assert [h.word for h in hits] == ["shit"]
+
+
+def test_parse_transcript_response_reads_local_whisper_probabilities():
+    chunk = AudioChunk(index=0, path=Path("dummy.wav"), start_time=0.0, duration=5.0)
+    # Shape returned by `whisper`'s model.transcribe(..., word_timestamps=True).
+    raw = {
+        "text": " oh shit",
+        "language": "en",
+        "segments": [
+            {
+                "id": 0,
+                "start": 1.0,
+                "end": 2.0,
+                "text": " oh shit",
+                "avg_logprob": -0.2,
+                "words": [
+                    {"word": " oh", "start": 1.0, "end": 1.2, "probability": 0.5},
+                    {"word": " shit", "start": 1.2, "end": 2.0, "probability": 0.7},
+                ],
+            }
+        ],
+    }
+
+    _, (seg,) = transcriber_mod._parse_transcript_response(raw, chunk, chunk_index=0)  # type: ignore[attr-defined]
+
+    assert [(w.word, w.confidence) for w in seg.words] == [("oh", 0.5), ("shit", 0.7)]
+    assert seg.avg_confidence == pytest.approx(0.6)
+    assert seg.text == "oh shit"
+
+
+def test_chunk_executor_uses_processes_only_for_parallel_local_whisper():
+    from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+    cases = [
+        ("local_whisper", 2, ProcessPoolExecutor),
+        ("local_whisper", 1, ThreadPoolExecutor),
+        ("openai_api", 4, ThreadPoolExecutor),
+    ]
+    for backend, workers, expected in cases:
+        executor = transcriber_mod._chunk_executor(_dummy_config(whisper_backend=backend), workers)  # type: ignore[attr-defined]
+        try:
+            assert type(executor) is expected
+        finally:
+            executor.shutdown()
+
+
+def test_chunk_executor_workers_inherit_the_parent_logging_level(monkeypatch: pytest.MonkeyPatch):
+    import logging
+
+    root = logging.getLogger()
+    monkeypatch.setattr(root, "level", logging.DEBUG)
+
+    executor = transcriber_mod._chunk_executor(_dummy_config(whisper_backend="local_whisper"), 2)  # type: ignore[attr-defined]
+    try:
+        # Bound methods of the root logger pickle by name, so these run in the worker.
+        assert executor.submit(logging.root.getEffectiveLevel).result(timeout=60) == logging.DEBUG
+        assert executor.submit(logging.root.hasHandlers).result(timeout=60) is True
+    finally:
+        executor.shutdown()
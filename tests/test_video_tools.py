@@ -3,13 +3,17 @@ from __future__ import annotations
 from pathlib import Path
 from types import SimpleNamespace
 
+import pytest
+
 from src.config import AppConfig
 from src.domain import ProfanitySpan
 from src.video_tools import (
     _build_ffmpeg_censor_and_mux_cmd,
     build_bleep_filter,
     build_mute_filter,
+    clear_probe_cache,
     input_has_clean_track_marker,
+    probe_audio,
     probe_primary_audio_codec_bitrate_and_count,
 )
 
@@ -26,6 +30,39 @@ def test_build_mute_filter_generates_volume_filters():
     assert "volume=enable='between(t,3.500,4.050)'" in af
 
 
+def test_build_mute_and_bleep_filters_merge_overlapping_spans():
+    spans = [
+        ProfanitySpan(start=5.0, end=6.0, hits=[], max_confidence=0.9),
+        ProfanitySpan(start=1.0, end=2.0, hits=[], max_confidence=0.9),
+        # Starts inside the padded tail of the 1.0-2.0 span.
+        ProfanitySpan(start=2.1, end=2.5, hits=[], max_confidence=0.9),
+    ]
+
+    af = build_mute_filter(spans)
+    assert af == (
+        "volume=enable='between(t,1.000,2.650)':volume=0,"
+        "volume=enable='between(t,5.000,6.150)':volume=0"
+    )
+
+    fc = build_bleep_filter(spans + [ProfanitySpan(start=1.5, end=1.8, hits=[], max_confidence=0.9)])
+    assert fc is not None
+    # One generator, split across the three merged spans.
+    assert fc.count("aevalsrc=") == 1
+    assert "asplit=3[tone0][tone1][tone2]" in fc
+    assert "amix=inputs=4" in fc
+
+
+def test_filter_builders_short_circuit_empty_spans_and_reuse_results():
+    assert build_mute_filter([]) is None
+    assert build_bleep_filter([]) is None
+
+    spans = [ProfanitySpan(start=7.0, end=7.5, hits=[], max_confidence=0.9)]
+    same = [ProfanitySpan(start=7.0, end=7.5, hits=[], max_confidence=0.1)]
+    assert build_mute_filter(spans) is build_mute_filter(same)
+    assert build_bleep_filter(spans) is build_bleep_filter(same)
+    assert build_bleep_filter(spans, tone_input=1) != build_bleep_filter(spans)
+
+
 def test_build_bleep_filter_contains_expected_components():
     spans = [
         ProfanitySpan(start=1.0, end=2.0, hits=[], max_confidence=0.9),
@@ -33,10 +70,69 @@ def test_build_bleep_filter_contains_expected_components():
     fc = build_bleep_filter(spans, sample_rate=16000)
     assert fc is not None
     assert "aevalsrc=0.5*sin(2*PI*1000*t)" in fc
-    assert "adelay=" in fc
+    assert "adelay=1000:all=1" in fc
     assert "amix=inputs=" in fc
 
 
+def test_build_bleep_filter_mixes_many_tones_through_a_two_input_amix_tree():
+    spans = [ProfanitySpan(start=float(i), end=i + 0.5, hits=[], max_confidence=0.9) for i in range(6)]
+
+    fc = build_bleep_filter(spans)
+    assert fc is not None
+    nodes = [c for c in fc.split(";") if "amix=" in c]
+    # 7 inputs (original + 6 beeps) need 6 pairwise nodes; the last one emits [aout].
+    assert len(nodes) == 6
+    assert all("amix=inputs=2:normalize=0:dropout_transition=0" in n for n in nodes)
+    # Only the nodes fed by the original audio pin the output length.
+    assert [n.startswith(("[a0]", "[m0]", "[m3]")) for n in nodes] == ["duration=first" in n for n in nodes]
+    assert nodes[-1].endswith("[aout]")
+    assert sum(n.count("[b") for n in nodes) == 6
+
+
+def test_build_ffmpeg_cmd_bleep_gates_one_looped_prerendered_tone(tmp_path):
+    import wave
+
+    spans = [
+        ProfanitySpan(start=1.0, end=2.0, hits=[], max_confidence=0.9),
+        ProfanitySpan(start=4.0, end=4.05, hits=[], max_confidence=0.9),
+    ]
+    config = AppConfig(input_path=Path("in.mp4"), output_path=Path("out.mp4"), mode="bleep")
+
+    cmd = _build_ffmpeg_censor_and_mux_cmd(
+        input_video=Path("in.mp4"),
+        output_video=Path("out.mp4"),
+        spans=spans,
+        config=config,
+        primary_audio_codec="aac",
+        primary_audio_bit_rate=None,
+        input_audio_stream_count=1,
+        work_dir=tmp_path,
+    )
+
+    tone = tmp_path / "beep.wav"
+    with wave.open(str(tone), "rb") as wf:
+        assert (wf.getnchannels(), wf.getframerate(), wf.getnframes()) == (1, 16000, 16000)
+
+    assert cmd[3:9] == ["in.mp4", "-stream_loop", "-1", "-i", str(tone), "-filter_complex"]
+    fc = cmd[9]
+    assert "aevalsrc" not in fc
+    assert "[1:a]volume=0:enable='not(between(t,1.000,2.000)+between(t,4.000,4.100))'[b0]" in fc
+    assert "amix=inputs=2:normalize=0:duration=first[aout]" in fc
+
+    # Without a per-run work dir no tone file is written; aevalsrc is used.
+    cmd = _build_ffmpeg_censor_and_mux_cmd(
+        input_video=Path("in.mp4"),
+        output_video=Path("out.mp4"),
+        spans=spans,
+        config=config,
+        primary_audio_codec="aac",
+        primary_audio_bit_rate=None,
+        input_audio_stream_count=1,
+    )
+    assert "-stream_loop" not in cmd
+    assert "aevalsrc" in cmd[cmd.index("-filter_complex") + 1]
+
+
 def test_build_ffmpeg_cmd_preserves_other_audio_streams_and_reencodes_only_primary():
     spans = [ProfanitySpan(start=1.0, end=2.0, hits=[], max_confidence=0.9)]
     config = AppConfig(input_path=Path("in.mp4"), output_path=Path("out.mp4"), mode="mute")
@@ -73,13 +169,13 @@ def test_build_ffmpeg_cmd_preserves_other_audio_streams_and_reencodes_only_prima
     ]
 
 
-def test_probe_primary_audio_codec_bitrate_and_count_parses_ffprobe_json(monkeypatch):
-    def fake_run(cmd, stdout, stderr, text):  # noqa: ANN001
+def test_probe_primary_audio_codec_bitrate_and_count_parses_ffprobe_csv(monkeypatch):
+    def fake_run(cmd, **kwargs):  # noqa: ANN001
         assert cmd[:4] == ["ffprobe", "-v", "error", "-select_streams"]
         return SimpleNamespace(
             returncode=0,
-            stdout='{"streams":[{"codec_name":"eac3","bit_rate":"768000"},{"codec_name":"aac","bit_rate":"192000"}]}',
-            stderr="",
+            stdout=b"codec_name=eac3,bit_rate=768000\ncodec_name=aac,bit_rate=192000\n",
+            stderr=b"",
         )
 
     monkeypatch.setattr("src.video_tools.subprocess.run", fake_run)
@@ -89,17 +185,80 @@ def test_probe_primary_audio_codec_bitrate_and_count_parses_ffprobe_json(monkeyp
     assert count == 2
 
 
-def test_input_has_clean_track_marker_true_when_title_matches(monkeypatch):
-    def fake_run(cmd, stdout, stderr, text):  # noqa: ANN001
+def test_probe_audio_reads_format_fields_in_one_call(monkeypatch):
+    calls = []
+
+    def fake_run(cmd, **kwargs):  # noqa: ANN001
+        calls.append(cmd)
+        return SimpleNamespace(
+            returncode=0,
+            stdout=(
+                b"codec_name=AAC,sample_rate=48000,channels=2,channel_layout=stereo,"
+                b"duration=12.5,bit_rate=128000\n"
+                b"codec_name=ac3,sample_rate=48000,channels=6,channel_layout=5.1(side),"
+                b"duration=N/A,bit_rate=N/A\n"
+            ),
+            stderr=b"",
+        )
+
+    monkeypatch.setattr("src.video_tools.subprocess.run", fake_run)
+    probe = probe_audio(Path("missing.mp4"))
+
+    assert len(calls) == 1
+    assert (probe.codec_name, probe.bit_rate, probe.sample_rate) == ("aac", 128000, 48000)
+    assert (probe.channels, probe.channel_layout, probe.duration_sec) == (2, "stereo", 12.5)
+    assert probe.stream_count == 2
+
+
+def test_probe_results_are_cached_until_the_file_changes(monkeypatch, tmp_path):
+    calls = []
+
+    def fake_run(cmd, **kwargs):  # noqa: ANN001
+        calls.append(cmd)
+        return SimpleNamespace(returncode=0, stdout=b"codec_name=aac,bit_rate=N/A\n", stderr=b"")
+
+    monkeypatch.setattr("src.video_tools.subprocess.run", fake_run)
+    clear_probe_cache()
+    video = tmp_path / "in.mp4"
+    video.write_bytes(b"v1")
+
+    assert probe_primary_audio_codec_bitrate_and_count(video) == ("aac", None, 1)
+    assert probe_primary_audio_codec_bitrate_and_count(video) == ("aac", None, 1)
+    assert len(calls) == 1
+
+    video.write_bytes(b"v2 is longer")
+    probe_primary_audio_codec_bitrate_and_count(video)
+    assert len(calls) == 2
+    clear_probe_cache()
+
+
+def test_input_has_clean_track_marker_true_when_title_matches(monkeypatch, tmp_path):
+    calls = []
+
+    def fake_run(cmd, **kwargs):  # noqa: ANN001
+        calls.append(cmd)
         assert cmd[:4] == ["ffprobe", "-v", "error", "-select_streams"]
         return SimpleNamespace(
             returncode=0,
-            stdout='{"streams":[{"tags":{"title":"Clean"}}]}',
-            stderr="",
+            stdout=(
+                b"codec_name=aac,bit_rate=128000,tag:title=\"Main, English\"\n"
+                b"codec_name=aac,bit_rate=128000,tag:title=Clean\n"
+            ),
+            stderr=b"",
         )
 
     monkeypatch.setattr("src.video_tools.subprocess.run", fake_run)
-    assert input_has_clean_track_marker(Path("in.mp4")) is True
+    clear_probe_cache()
+    video = tmp_path / "in.mp4"
+    video.write_bytes(b"v")
+
+    assert input_has_clean_track_marker(video) is True
+    # The mux probe reuses the same ffprobe call.
+    probe = probe_audio(video)
+    assert probe.titles == ("Main, English", "Clean")
+    assert (probe.codec_name, probe.bit_rate, probe.stream_count) == ("aac", 128000, 2)
+    assert len(calls) == 1
+    clear_probe_cache()
 
 
 def test_build_ffmpeg_cmd_mkv_uses_map_0_to_preserve_streams():
@@ -124,3 +283,211 @@ def test_build_ffmpeg_cmd_mkv_uses_map_0_to_preserve_streams():
     assert map_args[0] == "0"
     assert "-map_chapters" in cmd
     assert "-map_metadata" in cmd
+
+
+def test_build_ffmpeg_cmd_copies_when_no_span_reaches_the_audio_and_picks_matching_encoders(monkeypatch):
+    import src.video_tools as vt
+
+    monkeypatch.setattr(vt, "_available_encoders", lambda: frozenset({"libopus"}))
+    config = AppConfig(input_path=Path("in.mp4"), output_path=Path("out.mp4"), mode="mute")
+
+    def build(spans, codec):  # noqa: ANN001
+        return _build_ffmpeg_censor_and_mux_cmd(
+            input_video=Path("in.mp4"),
+            output_video=Path("out.mp4"),
+            spans=spans,
+            config=config,
+            primary_audio_codec=codec,
+            primary_audio_bit_rate=None,
+            input_audio_stream_count=1,
+        )
+
+    before_start = [ProfanitySpan(start=-2.0, end=-1.0, hits=[], max_confidence=0.9)]
+    assert build(before_start, "aac") == ["ffmpeg", "-y", "-i", "in.mp4", "-c", "copy", "out.mp4"]
+
+    spans = [ProfanitySpan(start=1.0, end=2.0, hits=[], max_confidence=0.9)]
+    aac_cmd = build(spans, "aac")
+    assert ["-c:a:1", "aac"] == aac_cmd[aac_cmd.index("-c:a:1") : aac_cmd.index("-c:a:1") + 2]
+    # The AAC encoder keeps ffmpeg's default coder; output quality is not traded for speed.
+    assert "-aac_coder" not in aac_cmd
+    opus_cmd = build(spans, "opus")
+    assert ["-c:a:1", "libopus"] == opus_cmd[opus_cmd.index("-c:a:1") : opus_cmd.index("-c:a:1") + 2]
+
+
+def test_encoder_for_codec_name_normalizes_only_non_canonical_names(monkeypatch):
+    import src.video_tools as vt
+    from src.video_tools import _encoder_for_codec_name
+
+    monkeypatch.setattr(vt, "_available_encoders", lambda: frozenset({"libmp3lame"}))
+    assert _encoder_for_codec_name("mp3") == "libmp3lame"
+    assert _encoder_for_codec_name(" EAC3 ") == "eac3"
+    assert _encoder_for_codec_name(None) == "aac"
+    assert _encoder_for_codec_name("truehd") == "aac"
+
+
+def test_encoder_falls_back_to_aac_when_ffmpeg_lacks_the_library_encoder(monkeypatch):
+    import src.video_tools as vt
+
+    encoders_out = (
+        b"Encoders:\n"
+        b" A..... = Audio\n"
+        b" ------\n"
+        b" A....D aac                  AAC (Advanced Audio Coding)\n"
+        b" A....D libmp3lame           libmp3lame MP3 (MPEG audio layer 3)\n"
+    )
+
+    def fake_run(cmd, **kwargs):  # noqa: ANN001
+        assert cmd == ["ffmpeg", "-hide_banner", "-encoders"]
+        return SimpleNamespace(returncode=0, stdout=encoders_out, stderr=b"")
+
+    monkeypatch.setattr("src.video_tools.subprocess.run", fake_run)
+    vt._available_encoders.cache_clear()
+    try:
+        assert vt._encoder_for_codec_name("mp3") == "libmp3lame"
+        assert vt._encoder_for_codec_name("opus") == "aac"
+    finally:
+        vt._available_encoders.cache_clear()
+
+    with pytest.raises(TypeError):
+        vt._ENCODERS_BY_CODEC["flac"] = "flac"  # type: ignore[index]
+
+
+def test_apply_mute_muxes_spliced_aac_track_without_reencoding(monkeypatch):
+    import src.video_tools as vt
+
+    spliced = {}
+
+    def fake_splice(input_video, output_audio, intervals):  # noqa: ANN001
+        spliced["intervals"] = intervals
+        return True
+
+    cmds = []
+
+    def fake_run(cmd, **kwargs):  # noqa: ANN001
+        cmds.append(cmd)
+        return SimpleNamespace(returncode=0, stdout="", stderr="")
+
+    monkeypatch.setattr(vt, "probe_audio", lambda _p: vt.AudioProbe(codec_name="aac", stream_count=1))
+    monkeypatch.setattr(vt, "splice_silence_into_aac", fake_splice)
+    monkeypatch.setattr("src.video_tools.subprocess.run", fake_run)
+
+    spans = [ProfanitySpan(start=1.0, end=2.0, hits=[], max_confidence=0.9)]
+    config = AppConfig(input_path=Path("in.mp4"), output_path=Path("out.mp4"), mode="mute", aac_splice=True)
+    vt.apply_audio_filters_and_mux(Path("in.mp4"), Path("out.mp4"), spans, config)
+
+    assert spliced["intervals"] == [(1.0, 2.15)]
+    (cmd,) = cmds
+    assert cmd[4:6] == ["-i", cmd[5]] and cmd[5].endswith("clean.m4a")
+    assert "-filter_complex" not in cmd
+    assert "1:a:0" in cmd
+    assert not any(token.startswith("-c:a:") for token in cmd)
+
+
+def test_apply_mute_skips_aac_splice_unless_enabled(monkeypatch):
+    import src.video_tools as vt
+
+    def fail_splice(*args):  # noqa: ANN002
+        raise AssertionError("AAC splice is opt-in")
+
+    cmds = []
+
+    def fake_run(cmd, **kwargs):  # noqa: ANN001
+        cmds.append(cmd)
+        return SimpleNamespace(returncode=0, stdout="", stderr="")
+
+    monkeypatch.setattr(vt, "probe_audio", lambda _p: vt.AudioProbe(codec_name="aac", stream_count=1))
+    monkeypatch.setattr(vt, "splice_silence_into_aac", fail_splice)
+    monkeypatch.setattr("src.video_tools.subprocess.run", fake_run)
+
+    spans = [ProfanitySpan(start=1.0, end=2.0, hits=[], max_confidence=0.9)]
+    config = AppConfig(input_path=Path("in.mp4"), output_path=Path("out.mp4"), mode="mute")
+    vt.apply_audio_filters_and_mux(Path("in.mp4"), Path("out.mp4"), spans, config)
+
+    (cmd,) = cmds
+    assert "-filter_complex" in cmd
+
+
+def test_apply_reads_binary_stderr_only_on_failure(monkeypatch):
+    import subprocess
+
+    import src.video_tools as vt
+
+    def fake_run(cmd, **kwargs):  # noqa: ANN001
+        assert "text" not in kwargs
+        assert kwargs["stdout"] is subprocess.DEVNULL
+        return SimpleNamespace(returncode=1, stdout=None, stderr="caf\u00e9 broke".encode("utf-8"))
+
+    monkeypatch.setattr("src.video_tools.subprocess.run", fake_run)
+    config = AppConfig(input_path=Path("in.mp4"), output_path=Path("out.mp4"), mode="mute", force_remux=True)
+
+    try:
+        vt.apply_audio_filters_and_mux(Path("in.mp4"), Path("out.mp4"), [], config)
+    except RuntimeError as exc:
+        assert "caf\u00e9 broke" in str(exc)
+    else:  # pragma: no cover
+        raise AssertionError("expected RuntimeError")
+
+
+def test_apply_without_spans_links_input_instead_of_running_ffmpeg(monkeypatch, tmp_path):
+    import src.video_tools as vt
+
+    def fake_run(cmd, **kwargs):  # noqa: ANN001
+        raise AssertionError("ffmpeg should not run")
+
+    monkeypatch.setattr("src.video_tools.subprocess.run", fake_run)
+    src_video = tmp_path / "in.mp4"
+    src_video.write_bytes(b"video")
+    out_video = tmp_path / "out.mp4"
+    out_video.write_bytes(b"stale")
+    config = AppConfig(input_path=src_video, output_path=out_video, mode="mute")
+
+    vt.apply_audio_filters_and_mux(src_video, out_video, [], config)
+    assert out_video.read_bytes() == b"video"
+    # A copy by default, so editing the output cannot touch the input.
+    assert out_video.stat().st_ino != src_video.stat().st_ino
+
+    # Opt-in hard link.
+    out_video.unlink()
+    config.hardlink_output = True
+    vt.apply_audio_filters_and_mux(src_video, out_video, [], config)
+    assert out_video.stat().st_ino == src_video.stat().st_ino
+
+    # Cross-device: hard link fails, fall back to a plain copy.
+    out_video.unlink()
+    monkeypatch.setattr(vt.os, "link", lambda *_a: (_ for _ in ()).throw(OSError("EXDEV")))
+    vt.apply_audio_filters_and_mux(src_video, out_video, [], config)
+    assert out_video.read_bytes() == b"video"
+    assert out_video.stat().st_ino != src_video.stat().st_ino
+
+
+def test_apply_without_spans_never_deletes_input_reached_by_another_path(monkeypatch, tmp_path):
+    import src.video_tools as vt
+
+    monkeypatch.setattr("src.video_tools.subprocess.run", lambda *a, **k: pytest.fail("ffmpeg should not run"))
+    src_video = tmp_path / "in.mp4"
+    src_video.write_bytes(b"video")
+    (tmp_path / "sub").mkdir()
+    same_video = tmp_path / "sub" / ".." / "in.mp4"
+    config = AppConfig(input_path=src_video, output_path=same_video, mode="mute")
+
+    vt.apply_audio_filters_and_mux(src_video, same_video, [], config)
+    assert src_video.read_bytes() == b"video"
+
+
+def test_link_or_copy_keeps_existing_output_when_copy_fails(monkeypatch, tmp_path):
+    import src.video_tools as vt
+
+    def fail(*_a):  # noqa: ANN002
+        raise OSError("EXDEV")
+
+    monkeypatch.setattr(vt.os, "link", fail)
+    monkeypatch.setattr(vt.shutil, "copyfile", fail)
+    src_video = tmp_path / "in.mp4"
+    src_video.write_bytes(b"video")
+    out_video = tmp_path / "out.mp4"
+    out_video.write_bytes(b"previous")
+
+    with pytest.raises(OSError):
+        vt.link_or_copy(src_video, out_video, hardlink=True)
+    assert out_video.read_bytes() == b"previous"
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["in.mp4", "out.mp4"]